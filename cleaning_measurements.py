@@ -0,0 +1,38 @@
+import cProfile
+import csv
+import glob
+import re
+
+from task_table import DataSet
+
+def get_clear_value_using_uncompiled_regex(value: str) -> str:
+    return '\n'.join([' '.join(re.sub("<.*?>", '', s).split()) for s in value.split('\n')])
+
+def read_rows(file_pattern):
+    rows = []
+    for file_name in glob.glob(file_pattern):
+        with open(file_name, 'r', encoding="utf-8-sig") as vacancies:
+            reader = csv.reader(vacancies)
+            list_naming = next(reader)
+            rows += [line for line in reader if len(line) == len(list_naming)]
+    return list_naming, rows
+
+def run_using_uncompiled_regex(rows):
+    print(f"Используя некомпилированное регулярное выражение для всех столбцов при обработке {len(rows)} строк")
+    return [[get_clear_value_using_uncompiled_regex(value) for value in line] for line in rows]
+
+def run_using_compiled_regex(rows):
+    print(f"Используя компилированное регулярное выражение для всех столбцов при обработке {len(rows)} строк")
+    return [[DataSet.get_clear_value(value) for value in line] for line in rows]
+
+def run_using_compiled_regex_for_markup_columns(rows, markup_columns_indexes):
+    print(f"Используя компилированное регулярное выражение для текстовых столбцов при обработке {len(rows)} строк")
+    return [[DataSet.get_clear_value(value) if i in markup_columns_indexes else value for i, value in enumerate(line)]
+            for line in rows]
+
+list_naming, vacancies_rows = read_rows("vacancies_*.csv")
+markup_columns = {"name", "description", "key_skills", "employer_name", "area_name"}
+markup_columns_indexes = {i for i, column in enumerate(list_naming) if column in markup_columns}
+cProfile.run("run_using_uncompiled_regex(vacancies_rows)")
+cProfile.run("run_using_compiled_regex(vacancies_rows)")
+cProfile.run("run_using_compiled_regex_for_markup_columns(vacancies_rows, markup_columns_indexes)")
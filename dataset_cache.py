@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+CACHE_DIR_NAME = ".dataset_cache"
+CACHE_VERSION = 1
+CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+HASH_BLOCK_SIZE = 1 << 20
+META_FILE_NAME = "meta.json"
+
+
+class StringColumn:
+    """Класс для представления строкового столбца кэша. Строки хранятся одним массивом байтов utf-8 и массивом
+    смещений, оба массива загружаются с отображением файла в память. Массив байтов декодируется один раз при первом
+    обращении к строкам.
+
+    Attributes:
+        blob (np.ndarray): Байты всех строк столбца в кодировке utf-8
+        offsets (np.ndarray): Смещения начала каждой строки в декодированном тексте и смещение конца текста
+        text (str): Декодированный текст всех строк столбца
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        """Инициализирует объект StringColumn.
+
+        Args:
+            blob (np.ndarray): Байты всех строк столбца в кодировке utf-8
+            offsets (np.ndarray): Смещения начала каждой строки в декодированном тексте и смещение конца текста
+        """
+        self.blob = blob
+        self.offsets = offsets
+        self.text = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_text(self):
+        """Возвращает декодированный текст всех строк столбца.
+
+        Returns:
+            str: Текст всех строк столбца
+        """
+        if self.text is None:
+            self.text = self.blob.tobytes().decode("utf-8")
+        return self.text
+
+    def __getitem__(self, i: int):
+        return self.get_text()[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        text = self.get_text()
+        offsets = self.offsets.tolist()
+        for i in range(len(offsets) - 1):
+            yield text[offsets[i]:offsets[i + 1]]
+
+
+def get_cache_dir(source_path: str) -> str:
+    """Возвращает путь до папки кэша, расположенной рядом с исходным файлом.
+
+    Args:
+        source_path (str): Путь до исходного файла
+
+    Returns:
+        str: Путь до папки кэша
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(source_path)), CACHE_DIR_NAME)
+
+
+def get_content_hash(source_path: str) -> str:
+    """Вычисляет хэш blake2b содержимого файла.
+
+    Args:
+        source_path (str): Путь до файла
+
+    Returns:
+        str: Шестнадцатеричная запись хэша
+    """
+    content_hash = hashlib.blake2b(digest_size=16)
+    with open(source_path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def get_cache_key(source_path: str, kind: str) -> str:
+    """Возвращает ключ записи кэша по пути, размеру, времени изменения и хэшу содержимого исходного файла, а также по
+    виду данных и версии формата кэша.
+
+    Args:
+        source_path (str): Путь до исходного файла
+        kind (str): Вид сохраняемых данных
+
+    Returns:
+        str: Ключ записи кэша
+    """
+    stat = os.stat(source_path)
+    fingerprint = json.dumps([os.path.abspath(source_path), stat.st_size, stat.st_mtime_ns,
+                              get_content_hash(source_path), kind, CACHE_VERSION])
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def save_columns(source_path: str, kind: str, columns: dict, size_limit: int = CACHE_SIZE_LIMIT,
+                 cache_key: str = None):
+    """Сохраняет столбцы данных, полученных из исходного файла, в кэш. Числовые столбцы сохраняются как массивы NumPy,
+    строковые - как массив байтов utf-8 и массив смещений. После сохранения из кэша удаляются давно не использованные
+    записи, если общий размер кэша превышает ограничение. Если записать кэш не удается (например, папка исходного файла
+    доступна только для чтения), запись пропускается.
+
+    Args:
+        source_path (str): Путь до исходного файла
+        kind (str): Вид сохраняемых данных
+        columns (dict): Словарь столбцов: массивов NumPy или списков строк
+        size_limit (int): Ограничение размера кэша в байтах
+        cache_key (str): Ключ записи кэша, по умолчанию вычисляется по исходному файлу
+
+    Returns:
+        bool: True, если запись сохранена в кэш или уже была в нем, иначе False
+    """
+    cache_dir = get_cache_dir(source_path)
+    entry_dir = os.path.join(cache_dir, cache_key or get_cache_key(source_path, kind))
+    if os.path.isdir(entry_dir):
+        return True
+    temp_dir = f"{entry_dir}.tmp{os.getpid()}"
+    try:
+        write_entry(temp_dir, source_path, kind, columns)
+        os.rename(temp_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return os.path.isdir(entry_dir)
+    try:
+        evict(cache_dir, size_limit)
+    except OSError:
+        pass
+    return True
+
+
+def write_entry(entry_dir: str, source_path: str, kind: str, columns: dict):
+    """Записывает столбцы данных и файл описания в папку записи кэша.
+
+    Args:
+        entry_dir (str): Путь до папки записи кэша
+        source_path (str): Путь до исходного файла
+        kind (str): Вид сохраняемых данных
+        columns (dict): Словарь столбцов: массивов NumPy или списков строк
+    """
+    os.makedirs(entry_dir, exist_ok=True)
+    column_types = {}
+    for column_name, values in columns.items():
+        if isinstance(values, np.ndarray):
+            np.save(os.path.join(entry_dir, f"{column_name}.npy"), values)
+            column_types[column_name] = "array"
+        else:
+            lengths = np.fromiter((len(value) for value in values), dtype=np.int64, count=len(values))
+            offsets = np.concatenate(([0], np.cumsum(lengths)))
+            blob = np.frombuffer(''.join(values).encode("utf-8"), dtype=np.uint8)
+            np.save(os.path.join(entry_dir, f"{column_name}.blob.npy"), blob)
+            np.save(os.path.join(entry_dir, f"{column_name}.offsets.npy"), offsets)
+            column_types[column_name] = "str"
+    with open(os.path.join(entry_dir, META_FILE_NAME), 'w', encoding="utf-8") as meta:
+        json.dump({"source_path": os.path.abspath(source_path), "kind": kind, "columns": column_types}, meta,
+                  ensure_ascii=False)
+
+
+def load_columns(source_path: str, kind: str, cache_key: str = None):
+    """Загружает из кэша столбцы данных, полученных из исходного файла, если файл не изменился с момента сохранения.
+    Массивы загружаются с отображением файлов в память. Время изменения записи обновляется, чтобы она считалась
+    недавно использованной. Если запись не удается прочитать, она считается отсутствующей.
+
+    Args:
+        source_path (str): Путь до исходного файла
+        kind (str): Вид сохраненных данных
+        cache_key (str): Ключ записи кэша, по умолчанию вычисляется по исходному файлу
+
+    Returns:
+        dict: Словарь столбцов: массивов NumPy или объектов StringColumn, либо None, если записи в кэше нет
+    """
+    entry_dir = os.path.join(get_cache_dir(source_path), cache_key or get_cache_key(source_path, kind))
+    meta_path = os.path.join(entry_dir, META_FILE_NAME)
+    try:
+        if not os.path.isfile(meta_path):
+            return None
+        with open(meta_path, 'r', encoding="utf-8") as meta:
+            column_types = json.load(meta)["columns"]
+        columns = {}
+        for column_name, column_type in column_types.items():
+            if column_type == "array":
+                columns[column_name] = np.load(os.path.join(entry_dir, f"{column_name}.npy"), mmap_mode='r')
+            else:
+                columns[column_name] = StringColumn(
+                    np.load(os.path.join(entry_dir, f"{column_name}.blob.npy"), mmap_mode='r'),
+                    np.load(os.path.join(entry_dir, f"{column_name}.offsets.npy"), mmap_mode='r'))
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        os.utime(meta_path)
+    except OSError:
+        pass
+    return columns
+
+
+def get_entry_size(entry_dir: str) -> int:
+    """Возвращает размер записи кэша в байтах.
+
+    Args:
+        entry_dir (str): Путь до папки записи кэша
+
+    Returns:
+        int: Размер записи в байтах
+    """
+    return sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+
+
+def evict(cache_dir: str, size_limit: int = CACHE_SIZE_LIMIT):
+    """Удаляет из кэша давно не использованные записи, пока общий размер кэша превышает ограничение. Время последнего
+    использования записи определяется по времени изменения ее файла описания.
+
+    Args:
+        cache_dir (str): Путь до папки кэша
+        size_limit (int): Ограничение размера кэша в байтах
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        meta_path = os.path.join(entry.path, META_FILE_NAME)
+        if entry.is_dir() and os.path.isfile(meta_path):
+            entries.append((os.stat(meta_path).st_mtime_ns, entry.path, get_entry_size(entry.path)))
+    entries.sort()
+    total_size = sum(size for _, _, size in entries)
+    for _, entry_path, size in entries:
+        if total_size <= size_limit:
+            break
+        shutil.rmtree(entry_path, ignore_errors=True)
+        total_size -= size
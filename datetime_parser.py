@@ -0,0 +1,144 @@
+import datetime
+import functools
+
+import dateutil.parser
+import dateutil.tz
+import numpy as np
+
+EPOCH = datetime.datetime(1970, 1, 1)
+DATETIME_STR_LENGTH = 24
+DIGIT_POSITIONS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18, 20, 21, 22, 23]
+SEPARATORS = {4: '-', 7: '-', 10: 'T', 13: ':', 16: ':'}
+TIMEZONE_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def get_timezone_offset(offset_str: str) -> dateutil.tz.tzoffset:
+    """Возвращает часовой пояс по строке смещения вида +HHMM или +HH:MM. Объекты часовых поясов кэшируются, так как в
+    данных встречается лишь несколько различных смещений.
+
+    Args:
+        offset_str (str): Строка смещения часового пояса
+
+    Returns:
+        tzoffset: Часовой пояс
+
+    >>> get_timezone_offset("+0300") is get_timezone_offset("+0300")
+    True
+    >>> get_timezone_offset("-0130").utcoffset(None)
+    datetime.timedelta(days=-1, seconds=81000)
+    >>> get_timezone_offset("+03:30").utcoffset(None)
+    datetime.timedelta(seconds=12600)
+    """
+    offset_str = offset_str.replace(':', '')
+    sign = -1 if offset_str[0] == '-' else 1
+    offset_seconds = int(offset_str[1:3]) * 3600 + int(offset_str[3:5] or 0) * 60
+    return dateutil.tz.tzoffset(None, sign * offset_seconds)
+
+
+def convert_str_to_datetime(s: str) -> datetime.datetime:
+    """Преобразует строку вида YYYY-MM-DDTHH:MM:SS+HHMM или YYYY-MM-DDTHH:MM:SS+HH:MM в datetime с часовым поясом.
+
+    Args:
+        s (str): Строка даты и времени
+
+    Returns:
+        datetime: Дата и время
+
+    >>> convert_str_to_datetime("2022-11-23T00:00:00+0300").isoformat()
+    '2022-11-23T00:00:00+03:00'
+    >>> convert_str_to_datetime("2022-11-23T00:00:00+03:00").isoformat()
+    '2022-11-23T00:00:00+03:00'
+    """
+    return datetime.datetime(int(s[:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                             tzinfo=get_timezone_offset(s[19:]))
+
+
+def get_year(s: str) -> int:
+    """Возвращает год из строки вида YYYY-MM-DDTHH:MM:SS+HHMM без создания datetime.
+
+    Args:
+        s (str): Строка даты и времени
+
+    Returns:
+        int: Год
+
+    >>> get_year("2022-11-23T00:00:00+0300")
+    2022
+    """
+    return int(s[:4])
+
+
+def get_numbers(digits: np.ndarray, begin: int, end: int) -> np.ndarray:
+    """Собирает числа из цифр, стоящих в указанных позициях строк.
+
+    Args:
+        digits (np.ndarray): Двумерный массив цифр строк
+        begin (int): Позиция первой цифры числа
+        end (int): Позиция, следующая за последней цифрой числа
+
+    Returns:
+        np.ndarray: Массив чисел
+    """
+    result = np.zeros(len(digits), dtype=np.int64)
+    for i in range(begin, end):
+        result = result * 10 + digits[:, i]
+    return result
+
+
+def convert_str_column_to_datetime64(column) -> tuple:
+    """Векторно преобразует столбец строк вида YYYY-MM-DDTHH:MM:SS+HHMM во время публикации в UTC. Строки в другом
+    формате разбираются по одной с помощью dateutil.parser.isoparse.
+
+    Args:
+        column: Список или массив строк даты и времени
+
+    Returns:
+        tuple: Массив datetime64[s] времени в UTC, массив int64 секунд от начала эпохи и массив int32 смещений часового
+        пояса в секундах
+
+    >>> published_at, timestamps, offsets = convert_str_column_to_datetime64(["2022-11-23T00:00:00+0300",
+    ... "2007-12-03T17:34:36-0130", "2022-11-23 00:00:00+03:00"])
+    >>> published_at.tolist()
+    [datetime.datetime(2022, 11, 22, 21, 0), datetime.datetime(2007, 12, 3, 19, 4, 36), datetime.datetime(2022, 11, 22, 21, 0)]
+    >>> timestamps.tolist(), offsets.tolist()
+    ([1669150800, 1196708676, 1669150800], [10800, -5400, 10800])
+    """
+    strings = np.asarray(column, dtype=str).reshape(-1)
+    timestamps = np.zeros(len(strings), dtype=np.int64)
+    offsets = np.zeros(len(strings), dtype=np.int32)
+    if len(strings) == 0:
+        return timestamps.astype("datetime64[s]"), timestamps, offsets
+    is_valid = np.char.str_len(strings) == DATETIME_STR_LENGTH
+    codes = strings.astype(f"U{DATETIME_STR_LENGTH}").view(np.uint32).reshape(-1, DATETIME_STR_LENGTH).astype(np.int64)
+    for position, separator in SEPARATORS.items():
+        is_valid &= codes[:, position] == ord(separator)
+    signs = np.where(codes[:, 19] == ord('-'), -1, 1)
+    is_valid &= (codes[:, 19] == ord('+')) | (codes[:, 19] == ord('-'))
+    digits = codes - ord('0')
+    is_valid &= ((digits[:, DIGIT_POSITIONS] >= 0) & (digits[:, DIGIT_POSITIONS] <= 9)).all(axis=1)
+    year = get_numbers(digits, 0, 4)
+    month = get_numbers(digits, 5, 7)
+    day = get_numbers(digits, 8, 10)
+    hour = get_numbers(digits, 11, 13)
+    minute = get_numbers(digits, 14, 16)
+    second = get_numbers(digits, 17, 19)
+    offset_hours = get_numbers(digits, 20, 22)
+    offset_minutes = get_numbers(digits, 22, 24)
+    is_valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (hour < 24) & (minute < 60) & \
+                (second < 60) & (offset_hours < 24) & (offset_minutes < 60)
+    month_begin = (np.where(is_valid, year, 1970) - 1970).astype("datetime64[Y]") + \
+                  (np.where(is_valid, month, 1) - 1).astype("timedelta64[M]")
+    month_days = ((month_begin + 1).astype("datetime64[D]") - month_begin.astype("datetime64[D]")).astype(np.int64)
+    is_valid &= day <= month_days
+    days = month_begin.astype("datetime64[D]").astype(np.int64) + day - 1
+    offset_seconds = signs * (offset_hours * 3600 + offset_minutes * 60)
+    timestamps[is_valid] = (days * 86400 + hour * 3600 + minute * 60 + second - offset_seconds)[is_valid]
+    offsets[is_valid] = offset_seconds[is_valid]
+    for i in np.flatnonzero(~is_valid).tolist():
+        parsed = dateutil.parser.isoparse(strings[i])
+        utc_offset = parsed.utcoffset()
+        offset = int(utc_offset.total_seconds()) if utc_offset is not None else 0
+        timestamps[i] = int((parsed.replace(tzinfo=None) - EPOCH).total_seconds()) - offset
+        offsets[i] = offset
+    return timestamps.astype("datetime64[s]"), timestamps, offsets
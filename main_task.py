@@ -11,7 +11,7 @@ class Launcher:
         if self.output_type == "Вакансии":
             app = task_table.InputConnect()
         elif self.output_type == "Статистика":
-            app = task_statistics.InputConnect()
+            app = task_statistics.InputConnect(task_statistics.parse_arguments().snapshot)
         else:
             print("Введен неверный тип вывода!")
 
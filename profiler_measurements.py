@@ -4,6 +4,8 @@ import datetime
 import dateutil.tz
 import dateutil.parser
 
+import datetime_parser
+
 def generate_datetime(min_year=1900, max_year=datetime.datetime.now().year):
     start = datetime.datetime(min_year, 1, 1, 00, 00, 00)
     years = max_year - min_year + 1
@@ -42,7 +44,12 @@ def run_using_dateutil_parser(datetime_strings):
     print(f"Используя dateutil.parser при обработке {len(datetime_strings)} строк")
     return [convert_str_to_datetime_using_dateutil_parser(s) for s in datetime_strings]
 
+def run_using_vectorized_parsing(datetime_strings):
+    print(f"Используя векторный парсинг столбца при обработке {len(datetime_strings)} строк")
+    return datetime_parser.convert_str_column_to_datetime64(datetime_strings)
+
 random_datetimes_as_strings = [generate_datetime().isoformat() + "+0300" for i in range(100000)]
 cProfile.run("run_using_strptime(random_datetimes_as_strings)")
 cProfile.run("run_using_string_parsing(random_datetimes_as_strings)")
-cProfile.run("run_using_dateutil_parser(random_datetimes_as_strings)")
\ No newline at end of file
+cProfile.run("run_using_dateutil_parser(random_datetimes_as_strings)")
+cProfile.run("run_using_vectorized_parsing(random_datetimes_as_strings)")
\ No newline at end of file
@@ -3,7 +3,6 @@ import csv
 import re
 import itertools
 import datetime
-import dateutil.tz
 import os
 
 from openpyxl import Workbook
@@ -17,6 +16,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from prettytable import prettytable
 
+import datetime_parser
+
 def profile(func):
     def wrapper(*args, **kwargs):
         datafn = func.__name__ + ".oldprofile"
@@ -91,18 +92,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
@@ -425,7 +415,7 @@ class DataSet:
         self.fraction_by_area = {}
         self.fraction_by_area_appropriate = {}
         for vacancy in self.vacancies:
-            year = int(vacancy.published_at.strftime("%Y"))
+            year = vacancy.published_at.year
             salary = vacancy.salary.get_rub_average()
             if year not in self.salary_by_year:
                 self.salary_by_year[year] = 0
@@ -6,7 +6,6 @@ import itertools
 import datetime
 from os.path import isfile, join
 
-import dateutil.tz
 import os
 
 from openpyxl import Workbook
@@ -22,6 +21,7 @@ import multiprocessing as mp
 from prettytable import prettytable
 
 import csv_splitter
+import datetime_parser
 
 
 def profile(func):
@@ -98,18 +98,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
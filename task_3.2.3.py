@@ -1,12 +1,20 @@
+import argparse
+import array
 import cProfile
 import concurrent.futures
 import csv
+import io
+import mmap
+import operator
 import re
 import itertools
 import datetime
+import functools
+import heapq
+import threading
+import time
 from os.path import isfile, join
 
-import dateutil.tz
 import os
 
 from openpyxl import Workbook
@@ -16,12 +24,13 @@ from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles.numbers import FORMAT_PERCENTAGE_00
 from jinja2 import Environment, FileSystemLoader
 import pdfkit
+import wcwidth
 import matplotlib.pyplot as plt
 import numpy as np
-import multiprocessing as mp
 from prettytable import prettytable
 
 import csv_splitter
+import datetime_parser
 
 
 def profile(func):
@@ -85,7 +94,8 @@ class Vacancy:
         self.name = name
         self.salary = salary
         self.area_name = area_name
-        self.published_at = Vacancy.convert_str_to_datetime_using_string_parsing(published_at)
+        self.published_at = Vacancy.convert_str_to_datetime_using_string_parsing(published_at) \
+            if published_at is not None else None
         self.description = description
         self.key_skills = key_skills
         self.experience_id = experience_id
@@ -98,18 +108,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
@@ -173,15 +172,727 @@ class Salary:
         return salary_average * Salary.currency_to_rub[self.salary_currency]
 
 
+class VacancyFrame:
+    """Класс для колоночного представления вакансий. Числовые поля хранятся в массивах NumPy, а строковые поля
+    закодированы целочисленными кодами словаря значений.
+
+    Attributes:
+        categorical_columns (list): (class attribute) Столбцы csv файла, кодируемые словарем значений
+        sorting_columns (dict): (class attribute) Словарь категориальных столбцов для параметров сортировки
+        experience_order (dict): (class attribute) Словарь для перевода опыта в число, используемое для сравнения
+        salary_from (np.ndarray): Нижние границы вилки оклада
+        salary_to (np.ndarray): Верхние границы вилки оклада
+        rub_average (np.ndarray): Средние зарплаты в рублях
+        published_at (np.ndarray): Время публикации вакансий в секундах от начала эпохи
+        published_at_offset (np.ndarray): Смещение часового пояса времени публикации в секундах
+        codes (dict): Массивы кодов значений для каждого категориального столбца
+        categories (dict): Списки значений для каждого категориального столбца, индексируемые кодами
+    """
+
+    categorical_columns = ["name", "description", "key_skills", "employer_name", "experience_id", "premium",
+                           "salary_gross", "salary_currency", "area_name"]
+    sorting_columns = {"Название": "name", "Описание": "description", "Навыки": "key_skills",
+                       "Опыт работы": "experience_id", "Премиум-вакансия": "premium", "Компания": "employer_name",
+                       "Название региона": "area_name"}
+    experience_order = {"noExperience": 0, "between1And3": 1, "between3And6": 2}
+
+    def __init__(self, salary_from: np.ndarray, salary_to: np.ndarray, published_at: np.ndarray,
+                 published_at_offset: np.ndarray, codes: dict, categories: dict):
+        """Инициализирует объект VacancyFrame, вычисляет средние зарплаты в рублях.
+
+        Args:
+            salary_from (np.ndarray): Нижние границы вилки оклада
+            salary_to (np.ndarray): Верхние границы вилки оклада
+            published_at (np.ndarray): Время публикации вакансий в секундах от начала эпохи
+            published_at_offset (np.ndarray): Смещение часового пояса времени публикации в секундах
+            codes (dict): Массивы кодов значений для каждого категориального столбца
+            categories (dict): Списки значений для каждого категориального столбца
+        """
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.published_at = published_at
+        self.published_at_offset = published_at_offset
+        self.codes = codes
+        self.categories = categories
+        rates = np.array([Salary.currency_to_rub[currency] for currency in categories["salary_currency"]],
+                         dtype=np.float64)
+        self.rub_average = (salary_from + salary_to) / 2 * rates[codes["salary_currency"]]
+
+    def __len__(self):
+        return len(self.published_at)
+
+    @staticmethod
+    def from_rows(rows, list_naming: list, clear_values: bool = False, columns: list = None):
+        """Создает VacancyFrame из строк csv файла, пропуская строки, содержащие не все необходимые данные.
+
+        Args:
+            rows: Итерируемый объект строк csv файла
+            list_naming (list): Названия столбцов csv файла
+            clear_values (bool): Флаг очистки от html тегов и лишних пробелов значений столбцов, которые могут содержать
+            html разметку
+            columns (list): Категориальные столбцы, которые требуется сохранить, по умолчанию сохраняются все
+            категориальные столбцы файла
+
+        Returns:
+            VacancyFrame: Вакансии в колоночном представлении
+
+        >>> frame = VacancyFrame.from_rows([["Программист", "20000.0", "30000.0", "RUR", "Москва",
+        ... "2022-11-23T00:00:00+0300"], ["Аналитик", "1000", "", "USD", "Москва", "2022-11-23T00:00:00+0300"]],
+        ... ["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+        >>> len(frame), frame.rub_average.tolist(), frame.categories["area_name"]
+        (1, [25000.0], ['Москва'])
+        """
+        column_indexes = {column: i for i, column in enumerate(list_naming)}
+        categorical_columns = [column for column in VacancyFrame.categorical_columns if column in column_indexes
+                               and (columns is None or column in columns)]
+        salary_from_i = column_indexes["salary_from"]
+        salary_to_i = column_indexes["salary_to"]
+        published_at_i = column_indexes["published_at"]
+        markup_indexes = {column_indexes[column] for column in DataSet.markup_columns if column in column_indexes}
+        salary_from, salary_to = array.array('d'), array.array('d')
+        published_at = []
+        codes = {column: array.array('i') for column in categorical_columns}
+        categories = {column: [] for column in categorical_columns}
+        encoders = {column: {} for column in categorical_columns}
+        for line in rows:
+            if len(line) != len(list_naming) or '' in line:
+                continue
+            if clear_values:
+                line = [DataSet.get_clear_value(value) if i in markup_indexes else value for i, value in enumerate(line)]
+            for column in categorical_columns:
+                value = line[column_indexes[column]]
+                code = encoders[column].get(value)
+                if code is None:
+                    code = encoders[column][value] = len(categories[column])
+                    categories[column].append(value)
+                codes[column].append(code)
+            salary_from.append(int(float(line[salary_from_i])))
+            salary_to.append(int(float(line[salary_to_i])))
+            published_at.append(line[published_at_i])
+        _, timestamps, offsets = datetime_parser.convert_str_column_to_datetime64(published_at)
+        return VacancyFrame(np.frombuffer(salary_from, dtype=np.float64), np.frombuffer(salary_to, dtype=np.float64),
+                            timestamps, offsets,
+                            {column: np.frombuffer(codes[column], dtype=np.int32) for column in codes}, categories)
+
+    def take(self, indexes: np.ndarray):
+        """Возвращает VacancyFrame, содержащий вакансии с указанными индексами в указанном порядке.
+
+        Args:
+            indexes (np.ndarray): Индексы вакансий
+
+        Returns:
+            VacancyFrame: Выбранные вакансии
+        """
+        frame = VacancyFrame.__new__(VacancyFrame)
+        frame.salary_from = self.salary_from[indexes]
+        frame.salary_to = self.salary_to[indexes]
+        frame.rub_average = self.rub_average[indexes]
+        frame.published_at = self.published_at[indexes]
+        frame.published_at_offset = self.published_at_offset[indexes]
+        frame.codes = {column: self.codes[column][indexes] for column in self.codes}
+        frame.categories = self.categories
+        return frame
+
+    def get_values(self, column: str):
+        """Возвращает декодированные значения категориального столбца.
+
+        Args:
+            column (str): Название столбца
+
+        Returns:
+            list: Значения столбца для каждой вакансии
+        """
+        categories = self.categories[column]
+        return [categories[code] for code in self.codes[column].tolist()]
+
+    def get_local_days(self):
+        """Возвращает номера дней публикации вакансий от начала эпохи с учетом часового пояса публикации.
+
+        Returns:
+            np.ndarray: Номера дней
+        """
+        return (self.published_at + self.published_at_offset) // 86400
+
+    def get_years(self):
+        """Возвращает года публикации вакансий с учетом часового пояса публикации.
+
+        Returns:
+            np.ndarray: Года публикации
+        """
+        return self.get_local_days().astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+    def check_column(self, column: str):
+        """Проверяет, что категориальный столбец сохранен в колоночном представлении.
+
+        Args:
+            column (str): Название столбца
+
+        Raises:
+            ValueError: Если столбец не сохранен
+        """
+        if column not in self.codes:
+            raise ValueError(f"Столбец {column} не сохранен в колоночном представлении вакансий")
+
+    def get_category_mask(self, column: str, matches):
+        """Возвращает маску вакансий, значение столбца которых удовлетворяет условию. Условие проверяется один раз для
+        каждого уникального значения столбца.
+
+        Args:
+            column (str): Название столбца
+            matches: Функция проверки значения столбца
+
+        Returns:
+            np.ndarray: Булева маска вакансий
+
+        Raises:
+            ValueError: Если столбец не сохранен в колоночном представлении
+        """
+        self.check_column(column)
+        category_mask = np.array([matches(value) for value in self.categories[column]], dtype=bool)
+        return category_mask[self.codes[column]] if len(category_mask) else np.zeros(len(self), dtype=bool)
+
+    def get_filter_mask(self, filter_key: str, filter_value):
+        """Возвращает маску вакансий, соответствующих значению параметра фильтрации. Неизвестные параметры фильтрации
+        не соответствуют ни одной вакансии.
+
+        Args:
+            filter_key (str): Параметр фильтрации
+            filter_value (str): Значение параметра фильтрации
+
+        Returns:
+            np.ndarray: Булева маска вакансий
+
+        Raises:
+            ValueError: Если столбец параметра фильтрации не сохранен в колоночном представлении
+
+        >>> frame = VacancyFrame.from_rows([["Программист", "Код", "Python\\nGit", "20000.0", "30000.0", "RUR",
+        ... "2022-11-23T00:00:00+0300"], ["Аналитик", "Отчеты", "SQL", "10000", "15000", "RUR", "2022-11-23T00:00:00+0300"]],
+        ... ["name", "description", "key_skills", "salary_from", "salary_to", "salary_currency", "published_at"])
+        >>> frame.get_filter_mask("Навыки", "Git, Python").tolist()
+        [True, False]
+        >>> frame.get_filter_mask("Название региона", "Москва")
+        Traceback (most recent call last):
+        ...
+        ValueError: Столбец area_name не сохранен в колоночном представлении вакансий
+        """
+        if filter_key == "Название":
+            return self.get_category_mask("name", lambda value: value == filter_value)
+        elif filter_key == "Описание":
+            return self.get_category_mask("description", lambda value: value == filter_value)
+        elif filter_key == "Навыки":
+            filter_skills = filter_value.split(", ")
+            return self.get_category_mask("key_skills", lambda value: all(filter_skill in value.split('\n')
+                                                                          for filter_skill in filter_skills))
+        elif filter_key == "Опыт работы":
+            return self.get_category_mask("experience_id",
+                                          lambda value: InputConnect.experience_naming[value] == filter_value)
+        elif filter_key == "Премиум-вакансия":
+            return self.get_category_mask("premium",
+                                          lambda value: filter_value == ("Да" if value == "True" else "Нет"))
+        elif filter_key == "Компания":
+            return self.get_category_mask("employer_name", lambda value: value == filter_value)
+        elif filter_key == "Оклад":
+            salary_value = int(filter_value)
+            return (self.salary_from <= salary_value) & (salary_value <= self.salary_to)
+        elif filter_key == "Название региона":
+            return self.get_category_mask("area_name", lambda value: value == filter_value)
+        elif filter_key == "Дата публикации вакансии":
+            try:
+                day = datetime.datetime.strptime(filter_value, "%d.%m.%Y").date()
+            except ValueError:
+                return np.zeros(len(self), dtype=bool)
+            return self.get_local_days() == (day - datetime.date(1970, 1, 1)).days
+        elif filter_key == "Идентификатор валюты оклада":
+            return self.get_category_mask("salary_currency",
+                                          lambda value: InputConnect.currency_naming[value] == filter_value)
+        return np.zeros(len(self), dtype=bool)
+
+    def filter(self, filter_key: str, filter_value):
+        """Возвращает VacancyFrame, содержащий только вакансии, соответствующие значению параметра фильтрации.
+
+        Args:
+            filter_key (str): Параметр фильтрации
+            filter_value (str): Значение параметра фильтрации
+
+        Returns:
+            VacancyFrame: Отфильтрованные вакансии
+        """
+        return self.take(np.flatnonzero(self.get_filter_mask(filter_key, filter_value)))
+
+    def get_category_ranks(self, column: str):
+        """Возвращает для каждой вакансии порядковый номер значения столбца среди всех его отсортированных значений.
+
+        Args:
+            column (str): Название столбца
+
+        Returns:
+            np.ndarray: Порядковые номера значений
+        """
+        categories = self.categories[column]
+        ranks = np.empty(len(categories), dtype=np.int64)
+        ranks[sorted(range(len(categories)), key=categories.__getitem__)] = np.arange(len(categories))
+        return ranks[self.codes[column]]
+
+    def get_category_keys(self, column: str, key):
+        """Возвращает для каждой вакансии числовой ключ значения столбца. Ключ вычисляется один раз для каждого
+        уникального значения столбца.
+
+        Args:
+            column (str): Название столбца
+            key: Функция вычисления ключа значения столбца
+
+        Returns:
+            np.ndarray: Ключи значений
+        """
+        category_keys = np.array([key(value) for value in self.categories[column]], dtype=np.int64)
+        return category_keys[self.codes[column]] if len(category_keys) else np.zeros(len(self), dtype=np.int64)
+
+    def get_sort_order(self, sorting_parameter: str, reverse_sort: bool = False):
+        """Возвращает порядок вакансий после устойчивой сортировки по параметру. Для неизвестных параметров порядок не
+        меняется.
+
+        Args:
+            sorting_parameter (str): Параметр сортировки
+            reverse_sort (bool): Флаг сортировки в обратном порядке
+
+        Returns:
+            np.ndarray: Индексы вакансий в отсортированном порядке
+
+        Raises:
+            ValueError: Если столбец параметра сортировки не сохранен в колоночном представлении
+        """
+        column = VacancyFrame.sorting_columns.get(sorting_parameter)
+        if sorting_parameter == "Оклад":
+            keys = self.rub_average
+        elif sorting_parameter == "Дата публикации вакансии":
+            keys = self.published_at
+        elif column is None:
+            return np.arange(len(self))
+        elif column not in self.codes:
+            self.check_column(column)
+        elif sorting_parameter == "Навыки":
+            keys = self.get_category_keys(column, lambda value: len(value.split('\n')))
+        elif sorting_parameter == "Опыт работы":
+            keys = self.get_category_keys(column, lambda value: VacancyFrame.experience_order.get(value, 3))
+        elif sorting_parameter == "Премиум-вакансия":
+            keys = self.get_category_keys(column, lambda value: value == "True")
+        else:
+            keys = self.get_category_ranks(column)
+        return np.argsort(-keys if reverse_sort else keys, kind="stable")
+
+    def sort(self, sorting_parameter: str, reverse_sort: bool = False):
+        """Возвращает VacancyFrame с вакансиями, отсортированными по параметру.
+
+        Args:
+            sorting_parameter (str): Параметр сортировки
+            reverse_sort (bool): Флаг сортировки в обратном порядке
+
+        Returns:
+            VacancyFrame: Отсортированные вакансии
+        """
+        return self.take(self.get_sort_order(sorting_parameter, reverse_sort))
+
+
+class PipelineConfig:
+    """Класс для представления настроек параллельного расчета статистики.
+
+    Attributes:
+        executor_types (list): (class attribute) Допустимые типы исполнителя
+        ingestion_modes (list): (class attribute) Допустимые способы чтения файла для статистики
+        executor_type (str): Тип исполнителя: "process" - пул процессов, "thread" - пул потоков, "serial" -
+        последовательная обработка в текущем потоке
+        max_workers (int): Количество исполнителей в пуле
+        chunk_size (int): Размер диапазона байтов для чтения файла по частям, по умолчанию файл делится на max_workers
+        частей
+        scratch_dir (str): Папка для временных csv файлов, разделенных по годам
+        ingestion_mode (str): Способ чтения файла для статистики: "chunks" - параллельная обработка диапазонов байтов
+        исходного файла, "years" - предварительное разделение файла по годам, "frame" - чтение файла в колоночное
+        представление и векторный расчет
+        report_timings (bool): Флаг вывода времени работы исполнителей
+    """
+
+    executor_types = ["process", "thread", "serial"]
+    ingestion_modes = ["chunks", "years", "frame"]
+
+    def __init__(self, executor_type: str = "process", max_workers: int = None, chunk_size: int = None,
+                 scratch_dir: str = "./splitted_csv/", ingestion_mode: str = "chunks", report_timings: bool = False):
+        """Инициализирует объект PipelineConfig.
+
+        Args:
+            executor_type (str): Тип исполнителя
+            max_workers (int): Количество исполнителей в пуле, по умолчанию равно количеству ядер процессора
+            chunk_size (int): Размер диапазона байтов для чтения файла по частям
+            scratch_dir (str): Папка для временных csv файлов, разделенных по годам
+            ingestion_mode (str): Способ чтения файла для статистики
+            report_timings (bool): Флаг вывода времени работы исполнителей
+
+        >>> PipelineConfig(max_workers=2).max_workers
+        2
+        >>> PipelineConfig(executor_type="fiber")
+        Traceback (most recent call last):
+        ...
+        ValueError: Тип исполнителя некорректен: fiber
+        """
+        if executor_type not in PipelineConfig.executor_types:
+            raise ValueError(f"Тип исполнителя некорректен: {executor_type}")
+        if ingestion_mode not in PipelineConfig.ingestion_modes:
+            raise ValueError(f"Способ чтения файла некорректен: {ingestion_mode}")
+        self.executor_type = executor_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.scratch_dir = scratch_dir
+        self.ingestion_mode = ingestion_mode
+        self.report_timings = report_timings
+
+    def get_chunk_size(self, file_size: int):
+        """Возвращает размер диапазона байтов для чтения файла указанного размера по частям.
+
+        Args:
+            file_size (int): Размер файла в байтах
+
+        Returns:
+            int: Размер диапазона в байтах
+
+        >>> PipelineConfig(max_workers=4).get_chunk_size(10)
+        3
+        >>> PipelineConfig(chunk_size=100).get_chunk_size(10)
+        100
+        """
+        if self.chunk_size is not None:
+            return self.chunk_size
+        return max(-(-file_size // self.max_workers), 1)
+
+    @staticmethod
+    def run_with_timing(function, *args):
+        """Выполняет функцию и измеряет время ее работы.
+
+        Args:
+            function: Функция для выполнения
+            *args: Аргументы функции
+
+        Returns:
+            tuple: Результат функции и словарь с идентификатором процесса, названием потока и временем работы в секундах
+        """
+        start = time.perf_counter()
+        result = function(*args)
+        timing = {"pid": os.getpid(), "thread": threading.current_thread().name,
+                  "seconds": time.perf_counter() - start}
+        return result, timing
+
+    def map(self, function, *iterables):
+        """Применяет функцию к аргументам с помощью исполнителя указанного типа.
+
+        Args:
+            function: Функция для выполнения
+            *iterables: Итерируемые объекты аргументов функции
+
+        Returns:
+            tuple: Список результатов функции и список времени работы для каждого вызова
+
+        >>> PipelineConfig(executor_type="serial").map(abs, [-1, 2])[0]
+        [1, 2]
+        """
+        timed_function = functools.partial(PipelineConfig.run_with_timing, function)
+        if self.executor_type == "serial":
+            results = list(map(timed_function, *iterables))
+        else:
+            if self.executor_type == "process":
+                executor_class = concurrent.futures.ProcessPoolExecutor
+            else:
+                executor_class = concurrent.futures.ThreadPoolExecutor
+            with executor_class(self.max_workers) as executor:
+                results = list(executor.map(timed_function, *iterables))
+        return [result for result, timing in results], [timing for result, timing in results]
+
+
+class PartialStatistics:
+    """Класс для представления частичной статистики, полученной при обработке части вакансий. Хранит суммы зарплат и
+    количества вакансий, поэтому частичные статистики разных частей файла можно объединять.
+
+    Attributes:
+        salary_by_year (dict): Словарь суммы зарплат по годам
+        vacancies_count_by_year (dict): Словарь количества вакансий по годам
+        selected_vacancy_salary_by_year (dict): Словарь суммы зарплат выбранной профессии по годам
+        selected_vacancy_count_by_year (dict): Словарь количества вакансий выбранной профессии по годам
+        salary_by_area (dict): Словарь суммы зарплат по городам
+        vacancies_count_by_area (dict): Словарь количества вакансий по городам
+    """
+
+    def __init__(self):
+        """Инициализирует пустой объект PartialStatistics."""
+        self.salary_by_year = {}
+        self.vacancies_count_by_year = {}
+        self.selected_vacancy_salary_by_year = {}
+        self.selected_vacancy_count_by_year = {}
+        self.salary_by_area = {}
+        self.vacancies_count_by_area = {}
+
+    @property
+    def vacancies_count(self):
+        """Общее количество вакансий в статистике."""
+        return sum(self.vacancies_count_by_year.values())
+
+    def get_dicts(self):
+        """Возвращает словари сумм и количеств статистики.
+
+        Returns:
+            tuple: Словари статистики
+        """
+        return (self.salary_by_year, self.vacancies_count_by_year, self.selected_vacancy_salary_by_year,
+                self.selected_vacancy_count_by_year, self.salary_by_area, self.vacancies_count_by_area)
+
+    def add(self, salary: float, area_name: str, year: int, is_selected: bool):
+        """Добавляет вакансию в статистику.
+
+        Args:
+            salary (float): Средняя зарплата вакансии в рублях
+            area_name (str): Регион вакансии
+            year (int): Год публикации вакансии
+            is_selected (bool): Флаг принадлежности вакансии к выбранной профессии
+
+        >>> statistics = PartialStatistics()
+        >>> statistics.add(20000.0, "Москва", 2022, True)
+        >>> statistics.add(30000.0, "Москва", 2022, False)
+        >>> statistics.salary_by_year, statistics.selected_vacancy_count_by_year, statistics.vacancies_count_by_area
+        ({2022: 50000.0}, {2022: 1}, {'Москва': 2})
+        """
+        self.salary_by_year[year] = self.salary_by_year.get(year, 0) + salary
+        self.vacancies_count_by_year[year] = self.vacancies_count_by_year.get(year, 0) + 1
+        if is_selected:
+            self.selected_vacancy_salary_by_year[year] = self.selected_vacancy_salary_by_year.get(year, 0) + salary
+            self.selected_vacancy_count_by_year[year] = self.selected_vacancy_count_by_year.get(year, 0) + 1
+        self.salary_by_area[area_name] = self.salary_by_area.get(area_name, 0) + salary
+        self.vacancies_count_by_area[area_name] = self.vacancies_count_by_area.get(area_name, 0) + 1
+
+    def merge(self, other: "PartialStatistics"):
+        """Добавляет к статистике суммы и количества другой частичной статистики.
+
+        Args:
+            other (PartialStatistics): Частичная статистика для объединения
+
+        Returns:
+            PartialStatistics: Объединенная статистика
+
+        >>> first, second = PartialStatistics(), PartialStatistics()
+        >>> first.add(20000.0, "Москва", 2021, False)
+        >>> second.add(30000.0, "Москва", 2022, True)
+        >>> merged = first.merge(second)
+        >>> merged.vacancies_count_by_year, merged.salary_by_area, merged.vacancies_count
+        ({2021: 1, 2022: 1}, {'Москва': 50000.0}, 2)
+        """
+        for target, source in zip(self.get_dicts(), other.get_dicts()):
+            for key, value in source.items():
+                target[key] = target.get(key, 0) + value
+        return self
+
+
+class MappedCsvReader:
+    """Класс для чтения csv файла, отображенного в память. Файл читается блоками байтов, границы которых совпадают с
+    границами записей, поэтому в памяти одновременно находится только один декодированный блок, а сами байты файла
+    берутся из страничного кэша. Блок декодируется целиком: декодирование в C дешевле, чем декодирование в Python
+    отдельных значений требуемых столбцов. Объект нужно закрыть методом close или использовать в блоке with.
+
+    Attributes:
+        block_size (int): (class attribute) Размер блока байтов, декодируемого за один раз
+        file (BufferedReader): Открытый файл
+        data (mmap): Байты файла, отображенные в память
+        list_naming (list): Названия столбцов csv файла
+        position (int): Позиция начала следующего блока
+    """
+
+    block_size = 1 << 22
+
+    def __init__(self, path_to_csv: str):
+        """Инициализирует объект MappedCsvReader: открывает файл, отображает его в память и считывает названия
+        столбцов.
+
+        Args:
+            path_to_csv (str): Путь до csv файла
+        """
+        self.file = open(path_to_csv, 'rb')
+        self.data = b''
+        if os.fstat(self.file.fileno()).st_size != 0:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        begin = 3 if self.data[:3] == b'\xef\xbb\xbf' else 0
+        self.position = DataSet.find_record_end(self.data, begin, begin)
+        self.list_naming = next(MappedCsvReader.get_block_reader(self.data, begin, self.position), [])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Закрывает отображение файла в память и сам файл."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b''
+        self.file.close()
+
+    @staticmethod
+    def get_block_reader(data, begin: int, end: int):
+        """Возвращает объект чтения строк из блока байтов файла. Переносы строк внутри значений приводятся к виду
+        '\\n' так же, как при чтении файла в текстовом режиме.
+
+        Args:
+            data: Байты файла
+            begin (int): Начало блока
+            end (int): Конец блока
+
+        Returns:
+            _reader: Объект чтения строк блока
+
+        >>> list(MappedCsvReader.get_block_reader(b'a,"b,""c""\\r\\nd",\\r\\n', 0, 17))
+        [['a', 'b,"c"\\nd', '']]
+        """
+        return csv.reader(io.TextIOWrapper(io.BytesIO(data[begin:end]), "utf-8", newline=None))
+
+    def read_rows(self, columns: list = None):
+        """Возвращает генератор строк csv файла. Значения столбцов, не входящих в требуемые, заменяются на пустую строку,
+        если значение пусто, и на None иначе, поэтому проверки количества столбцов и пустых значений работают так же,
+        как для всех столбцов, а дальнейшая обработка этих значений не выполняется.
+
+        Args:
+            columns (list): Названия требуемых столбцов, по умолчанию возвращаются все столбцы
+
+        Returns:
+            generator: Генератор строк csv файла
+        """
+        skipped_indexes = [] if columns is None else \
+            [i for i, column in enumerate(self.list_naming) if column not in columns]
+        while self.position < len(self.data):
+            begin = self.position
+            self.position = DataSet.find_record_end(self.data, begin,
+                                                    min(begin + MappedCsvReader.block_size, len(self.data)))
+            for line in MappedCsvReader.get_block_reader(self.data, begin, self.position):
+                if len(line) == len(self.list_naming):
+                    for i in skipped_indexes:
+                        line[i] = line[i] and None
+                yield line
+
+
+class SalaryIntervalTree:
+    """Класс для представления центрированного дерева интервалов вилок оклада. Каждый узел хранит значение центра и
+    вилки, содержащие центр, упорядоченные по нижней и по верхней границе. Вилки левее центра хранятся в левом
+    поддереве, правее центра - в правом. Центр узла выбирается медианой границ его вилок, поэтому глубина дерева
+    логарифмическая, а запрос возвращает k вилок за O(log n + k).
+
+    Attributes:
+        center (int): Центр узла
+        by_start (list): Пары нижней границы и номера вакансии для вилок узла в порядке возрастания нижней границы
+        by_end (list): Пары верхней границы и номера вакансии для вилок узла в порядке убывания верхней границы
+        left (SalaryIntervalTree): Поддерево вилок, лежащих левее центра
+        right (SalaryIntervalTree): Поддерево вилок, лежащих правее центра
+    """
+
+    def __init__(self, intervals: list):
+        """Инициализирует объект SalaryIntervalTree, строя дерево по вилкам оклада. Вилки, у которых нижняя граница
+        больше верхней, не сохраняются, так как не пересекаются ни с одним диапазоном.
+
+        Args:
+            intervals (list): Тройки нижней границы, верхней границы и номера вакансии
+        """
+        intervals = [interval for interval in intervals if interval[0] <= interval[1]]
+        endpoints = sorted(itertools.chain.from_iterable((start, end) for start, end, _ in intervals))
+        self.center = endpoints[len(endpoints) // 2] if endpoints else 0
+        left, right, middle = [], [], []
+        for interval in intervals:
+            if interval[1] < self.center:
+                left.append(interval)
+            elif interval[0] > self.center:
+                right.append(interval)
+            else:
+                middle.append(interval)
+        self.by_start = sorted((start, i) for start, _, i in middle)
+        self.by_end = sorted(((end, i) for _, end, i in middle), reverse=True)
+        self.left = SalaryIntervalTree(left) if left else None
+        self.right = SalaryIntervalTree(right) if right else None
+
+    def overlap(self, salary_from: int, salary_to: int):
+        """Возвращает номера вакансий, вилка оклада которых пересекается с диапазоном, включая границы.
+
+        Args:
+            salary_from (int): Нижняя граница диапазона
+            salary_to (int): Верхняя граница диапазона
+
+        Returns:
+            list: Номера вакансий в произвольном порядке
+
+        >>> tree = SalaryIntervalTree([(10000, 20000, 0), (30000, 50000, 1), (15000, 35000, 2), (60000, 60000, 3)])
+        >>> sorted(tree.overlap(20000, 30000))
+        [0, 1, 2]
+        >>> sorted(tree.overlap(55000, 70000))
+        [3]
+        >>> tree.overlap(51000, 59000)
+        []
+        """
+        result = []
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            if salary_to < node.center:
+                for start, i in node.by_start:
+                    if start > salary_to:
+                        break
+                    result.append(i)
+                if node.left is not None:
+                    nodes.append(node.left)
+            elif salary_from > node.center:
+                for end, i in node.by_end:
+                    if end < salary_from:
+                        break
+                    result.append(i)
+                if node.right is not None:
+                    nodes.append(node.right)
+            else:
+                result.extend(i for _, i in node.by_start)
+                if node.left is not None:
+                    nodes.append(node.left)
+                if node.right is not None:
+                    nodes.append(node.right)
+        return result
+
+    def stab(self, salary: int):
+        """Возвращает номера вакансий, вилка оклада которых содержит значение, включая границы.
+
+        Args:
+            salary (int): Значение оклада
+
+        Returns:
+            list: Номера вакансий в произвольном порядке
+
+        >>> sorted(SalaryIntervalTree([(10000, 20000, 0), (30000, 50000, 1), (15000, 35000, 2)]).stab(20000))
+        [0, 2]
+        """
+        return self.overlap(salary, salary)
+
+
 class DataSet:
     """Класс для представления данных вакансий.
 
     Attributes:
+        quotes_count_block_size (int): (class attribute) Размер блока байтов, в котором подсчитываются кавычки при
+        разделении файла на части
+        table_columns (list): (class attribute) Столбцы csv файла вакансий для вывода таблицы
+        sort_keys (dict): (class attribute) Словарь функций ключа сортировки для каждого параметра сортировки
+        columns_by_parameter (dict): (class attribute) Словарь столбцов csv файла, необходимых для вывода, фильтрации и
+        сортировки по каждому параметру
+        index_keys (dict): (class attribute) Словарь функций значения индексируемого столбца для каждого параметра
+        фильтрации, по которому строится индекс
+        markup_columns (set): (class attribute) Столбцы csv файла, которые могут содержать html разметку
+        html_tag_pattern (Pattern): (class attribute) Регулярное выражение html тега
+        dirty_str_pattern (Pattern): (class attribute) Регулярное выражение для поиска html тегов, переносов строк и
+        лишних пробелов
         __file_name (str): Имя файла для обработки данных
         __list_naming (list): Названия столбцов таблицы
-        reader (_reader): Объект чтения для чтения строк из файла
+        file: Открытый файл или объект MappedCsvReader
+        reader: Объект чтения для чтения строк из файла
         vacancies (list): Список вакансий
-        vacancies_by_year (dict): Словарь вакансий по годам
+        vacancy_frame (VacancyFrame): Вакансии в колоночном представлении
+        indexes (dict): Построенные индексы списка вакансий для параметров фильтрации, для параметра "Оклад" - дерево
+        интервалов вилок оклада
+        worker_timings (list): Время работы исполнителей при параллельном расчете статистики
         vacancies_length_before_filtering (int): Количество вакансий до фильтрации по параметру
                 salary_by_year (dict): Словарь средней зарплаты по годам
         vacancies_count_by_year (dict): Словарь количества вакансий по годам
@@ -208,8 +919,11 @@ class DataSet:
         """
         self.__file_name = file_name
         self.__list_naming = None
+        self.file = None
         self.vacancies = []
-        self.vacancies_by_year = {}
+        self.vacancy_frame = None
+        self.indexes = {}
+        self.worker_timings = []
         self.salary_by_year = {}
         self.vacancies_count_by_year = {}
         self.selected_vacancy_salary_by_year = {}
@@ -220,6 +934,29 @@ class DataSet:
         self.fraction_by_area = {}
         self.fraction_by_area_appropriate = {}
 
+    quotes_count_block_size = 1 << 20
+    table_columns = ["name", "description", "key_skills", "experience_id", "premium", "employer_name", "salary_from",
+                     "salary_to", "salary_gross", "salary_currency", "area_name", "published_at"]
+    sort_keys = {"Название": operator.attrgetter("name"), "Описание": operator.attrgetter("description"),
+                 "Навыки": lambda v: len(v.key_skills),
+                 "Опыт работы": lambda v: VacancyFrame.experience_order.get(v.experience_id, 3),
+                 "Премиум-вакансия": operator.attrgetter("premium"),
+                 "Компания": operator.attrgetter("employer_name"),
+                 "Оклад": operator.attrgetter("salary.rub_average"), "Название региона": operator.attrgetter("area_name"),
+                 "Дата публикации вакансии": operator.attrgetter("published_at")}
+    columns_by_parameter = {"Название": ["name"], "Описание": ["description"], "Навыки": ["key_skills"],
+                            "Опыт работы": ["experience_id"], "Премиум-вакансия": ["premium"],
+                            "Компания": ["employer_name"],
+                            "Оклад": ["salary_from", "salary_to", "salary_gross", "salary_currency"],
+                            "Идентификатор валюты оклада": ["salary_currency"], "Название региона": ["area_name"],
+                            "Дата публикации вакансии": ["published_at"]}
+    index_keys = {"Название региона": operator.attrgetter("area_name"),
+                  "Компания": operator.attrgetter("employer_name"),
+                  "Идентификатор валюты оклада": lambda v: InputConnect.currency_naming.get(v.salary.salary_currency)}
+    markup_columns = {"name", "description", "key_skills", "employer_name", "area_name"}
+    html_tag_pattern = re.compile("<.*?>")
+    dirty_str_pattern = re.compile(r"<|\s\s|^\s|\s$|[^\S ]")
+
     @staticmethod
     def get_clear_value(value: str):
         """Разделяет исходную строку по символу переноса строки, после чего очищает каждую отдельную строку от html тегов
@@ -238,6 +975,8 @@ class DataSet:
         >>> DataSet.get_clear_value("Без html-тегов\\nи лишних пробелов")
         'Без html-тегов\\nи лишних пробелов'
         """
+        if DataSet.dirty_str_pattern.search(value) is None:
+            return value
         temp = value.split('\n')
         result = [DataSet.get_clear_str(s) for s in temp]
         return '\n'.join(result)
@@ -258,8 +997,12 @@ class DataSet:
         'one two three 4'
         >>> DataSet.get_clear_str("<div><h1>Заголовок    1 уровня</h1></div>")
         'Заголовок 1 уровня'
+        >>> DataSet.get_clear_str(" \tбез тегов ")
+        'без тегов'
         """
-        str_without_tags = re.sub("<.*?>", '', s)
+        if DataSet.dirty_str_pattern.search(s) is None:
+            return s
+        str_without_tags = DataSet.html_tag_pattern.sub('', s)
         str_without_spaces = ' '.join(str_without_tags.split())
         return str_without_spaces
 
@@ -271,144 +1014,213 @@ class DataSet:
         """
         return False if self.__list_naming else True
 
-    def csv_reader_all_years(self):
-        """Открывает csv файлы, разделенные по годам, для чтения и заполняет список вакансий по годам."""
-        csv_files_by_years_dir_path = "./splitted_csv/"
-        years_filenames = [f for f in os.listdir(csv_files_by_years_dir_path) if isfile(join(csv_files_by_years_dir_path, f))]
-        with mp.Manager() as manager:
-            vacancies_by_year = manager.dict()
-            years = [int(year_filename.split('.')[0]) for year_filename in years_filenames]
-            paths = [csv_files_by_years_dir_path + year_filename for year_filename in years_filenames]
-            with concurrent.futures.ProcessPoolExecutor(4) as executor:
-                executor.map(DataSet.fill_vacancies_by_year, itertools.repeat(vacancies_by_year), paths, years)
-            self.vacancies_by_year = dict(vacancies_by_year)
+    @staticmethod
+    def add_lines_to_statistics(statistics: "PartialStatistics", reader, columns_count: int, selected_vacancy: str):
+        """Добавляет в частичную статистику вакансии из строк csv файла, содержащие все необходимые данные.
+
+        Args:
+            statistics (PartialStatistics): Частичная статистика
+            reader: Итерируемый объект строк csv файла
+            columns_count (int): Количество столбцов csv файла
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        for line in reader:
+            if len(line) == columns_count and '' not in line:
+                salary = Salary(int(float(line[1])), int(float(line[2])), line[3])
+                is_selected = selected_vacancy != '' and selected_vacancy in line[0]
+                statistics.add(salary.get_rub_average(), line[4], datetime_parser.get_year(line[5]), is_selected)
 
     @staticmethod
-    def get_csv_reader_by_year(path_to_year_csv: str):
-        """Возвращает csv reader и список названий столбцов для файла по указанному пути.
+    def get_statistics_by_year(path_to_year_csv: str, selected_vacancy: str):
+        """Производит расчет частичной статистики по вакансиям из csv файла, содержащего вакансии за один год.
 
         Args:
-            path_to_year_csv (str): Путь до csv файла по году.
+            path_to_year_csv (str): Путь до csv файла по году
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
 
         Returns:
-            Csv reader и список названий столбцов для файла по указанному пути
+            PartialStatistics: Частичная статистика по вакансиям года
+        """
+        statistics = PartialStatistics()
+        with open(path_to_year_csv, 'r', encoding="utf-8-sig") as vacancies_by_year:
+            reader_by_year = csv.reader(vacancies_by_year)
+            list_naming = next(reader_by_year, [])
+            DataSet.add_lines_to_statistics(statistics, reader_by_year, len(list_naming), selected_vacancy)
+        return statistics
+
+    def process_statistics_all_years(self, selected_vacancy: str, config: "PipelineConfig" = None):
+        """Производит расчет статистики для требуемой профессии по csv файлам, разделенным по годам. Каждый файл
+        обрабатывается отдельным исполнителем, который возвращает частичную статистику, после чего частичные статистики
+        объединяются.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+            config (PipelineConfig): Настройки параллельного расчета статистики
         """
-        vacancies_by_year = open(path_to_year_csv, 'r', encoding="utf-8-sig")
-        reader_by_year = csv.reader(vacancies_by_year)
-        list_naming = next(reader_by_year)
-        return reader_by_year, list_naming
+        config = config or PipelineConfig()
+        paths = [join(config.scratch_dir, f) for f in os.listdir(config.scratch_dir)
+                 if isfile(join(config.scratch_dir, f))]
+        years_statistics, self.worker_timings = config.map(DataSet.get_statistics_by_year, paths,
+                                                           itertools.repeat(selected_vacancy))
+        statistics = PartialStatistics()
+        for year_statistics in years_statistics:
+            statistics.merge(year_statistics)
+        self.complete_statistics(statistics)
 
     @staticmethod
-    def parse_vacancies_from_csv_by_year(vacancies_by_year: dict, reader_by_year, list_naming, year: int):
-        """Заполняет список вакансий по указанному году, используя переданный csv reader.
-
-        Args:
-            vacancies_by_year (dict): Словарь, содержащий списки вакансий по годам
-            reader_by_year: Сsv reader для указанного года
-            list_naming (list): Список столбцов
-            year (int): Год
-        """
-        vacancies = []
-        for line in reader_by_year:
-            if len(line) == len(list_naming) and '' not in line:
-                name = line[0]
-                salary_from = int(float(line[1]))
-                salary_to = int(float(line[2]))
-                salary_currency = line[3]
-                salary = Salary(salary_from, salary_to, salary_currency)
-                area_name = line[4]
-                published_at = line[5]
-                vacancy = Vacancy(name, salary, area_name, published_at)
-                salary.rub_average = salary.get_rub_average()
-                vacancies.append(vacancy)
-        vacancies_by_year[year] = vacancies
+    def count_quotes(data, begin: int, end: int):
+        """Подсчитывает кавычки в диапазоне байтов, не копируя весь диапазон в память.
+
+        Args:
+            data: Байты файла
+            begin (int): Начало диапазона
+            end (int): Конец диапазона
+
+        Returns:
+            int: Количество кавычек
+
+        >>> DataSet.count_quotes(b'"a","b"', 0, 5)
+        3
+        """
+        quotes_count = 0
+        for block_begin in range(begin, end, DataSet.quotes_count_block_size):
+            block_end = min(block_begin + DataSet.quotes_count_block_size, end)
+            quotes_count += data[block_begin:block_end].count(b'"')
+        return quotes_count
 
     @staticmethod
-    def fill_vacancies_by_year(vacancies_by_year: dict, path_to_year_csv: str, year: int):
-        """Заполняет список вакансий по указанному csv файлу и году.
+    def find_record_end(data, record_begin: int, position: int):
+        """Находит конец записи csv файла, которому принадлежит указанная позиция. Перенос строки считается концом
+        записи, только если от начала записи до него встретилось четное число кавычек, поэтому переносы строк внутри
+        значений в кавычках не разрывают запись.
 
         Args:
-            vacancies_by_year (dict): Словарь, содержащий списки вакансий по годам
-            path_to_year_csv (str): Путь до csv файла, содержащий вакансии за указанный год
-            year (int): Год
+            data: Байты файла
+            record_begin (int): Позиция начала записи, от которой ведется подсчет кавычек
+            position (int): Позиция, начиная с которой ищется конец записи
+
+        Returns:
+            int: Позиция, следующая за концом записи
+
+        >>> DataSet.find_record_end(b'a,"b\\nc"\\nd\\n', 0, 0)
+        8
+        >>> DataSet.find_record_end(b'a,"b\\nc"\\nd\\n', 0, 3)
+        8
+        >>> DataSet.find_record_end(b'a,"b\\nc"\\nd', 8, 8)
+        9
         """
-        reader_by_year, list_naming = DataSet.get_csv_reader_by_year(path_to_year_csv)
-        DataSet.parse_vacancies_from_csv_by_year(vacancies_by_year, reader_by_year, list_naming, year)
+        quotes_count = DataSet.count_quotes(data, record_begin, position)
+        while True:
+            line_end = data.find(b'\n', position)
+            if line_end == -1:
+                return len(data)
+            quotes_count += DataSet.count_quotes(data, position, line_end)
+            position = line_end + 1
+            if quotes_count % 2 == 0:
+                return position
 
     @staticmethod
-    def process_statistics_by_year(vacancies: list, salary_by_year: dict,
-                                   vacancies_count_by_year: dict, selected_vacancy_salary_by_year: dict,
-                                   selected_vacancy_count_by_year: dict, year: int, selected_vacancy: str):
-        """Производит расчет статистики по требуемой профессии в указанный год.
+    def get_csv_chunks(path_to_csv: str, chunk_size: int):
+        """Разделяет csv файл на диапазоны байтов размером не меньше chunk_size, границы которых совпадают с границами
+        записей. Строка заголовка в диапазоны не входит.
 
         Args:
-            vacancies (list): Список вакансий для обработки
-            salary_by_year (dict): Словарь зарплат по годам
-            vacancies_count_by_year (dict): Словарь количества вакансий по годам
-            selected_vacancy_salary_by_year (dict): Словарь зарплат по годам для выбранной профессии
-            selected_vacancy_count_by_year (dict): Словарь количества вакансий по годам для выбранной профессии
-            year (int): Год
+            path_to_csv (str): Путь до csv файла
+            chunk_size (int): Размер диапазона в байтах
+
+        Returns:
+            list: Список пар начала и конца диапазонов
+        """
+        chunks = []
+        with open(path_to_csv, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return chunks
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                begin = DataSet.find_record_end(data, 0, 0)
+                while begin < len(data):
+                    end = DataSet.find_record_end(data, begin, min(begin + chunk_size, len(data)))
+                    chunks.append((begin, end))
+                    begin = end
+        return chunks
+
+    @staticmethod
+    def get_chunk_reader(chunk: str):
+        """Возвращает csv reader по декодированному диапазону csv файла. Переводы строк внутри значений в кавычках
+        приводятся к \\n так же, как при чтении файла в текстовом режиме.
+
+        Args:
+            chunk (str): Декодированный диапазон csv файла
+
+        Returns:
+            csv.reader: Итератор по записям диапазона
+
+        >>> list(DataSet.get_chunk_reader('Программист,"Москва\\r\\nЦентр"\\r\\nАналитик,Казань\\r\\n'))
+        [['Программист', 'Москва\\nЦентр'], ['Аналитик', 'Казань']]
+        """
+        return csv.reader(io.StringIO(chunk, newline=None))
+
+    @staticmethod
+    def get_statistics_by_chunk(path_to_csv: str, begin: int, end: int, columns_count: int, selected_vacancy: str):
+        """Производит расчет частичной статистики по вакансиям из указанного диапазона байтов csv файла.
+
+        Args:
+            path_to_csv (str): Путь до csv файла
+            begin (int): Начало диапазона
+            end (int): Конец диапазона
+            columns_count (int): Количество столбцов csv файла
             selected_vacancy (str): Профессия, по которой требуется получить статистику
+
+        Returns:
+            PartialStatistics: Частичная статистика по вакансиям диапазона
         """
-        salary_by_year_result = 0
-        vacancies_count_by_year_result = 0
-        selected_vacancy_salary_by_year_result = 0
-        selected_vacancy_count_by_year_result = 0
-        for vacancy in vacancies:
-            salary = vacancy.salary.get_rub_average()
-            salary_by_year_result += salary
-            vacancies_count_by_year_result += 1
-            if selected_vacancy in vacancy.name and selected_vacancy != '':
-                selected_vacancy_salary_by_year_result += salary
-                selected_vacancy_count_by_year_result += 1
-        salary_by_year_result = int(salary_by_year_result / vacancies_count_by_year_result)
-        salary_by_year[year] = salary_by_year_result
-        vacancies_count_by_year[year] = vacancies_count_by_year_result
-        if selected_vacancy:
-            if selected_vacancy_salary_by_year_result != 0:
-                selected_vacancy_salary_by_year_result = int(
-                    selected_vacancy_salary_by_year_result / selected_vacancy_count_by_year_result)
-        selected_vacancy_salary_by_year[year] = selected_vacancy_salary_by_year_result
-        selected_vacancy_count_by_year[year] = selected_vacancy_count_by_year_result
-
-    def process_statistics_all_years(self, selected_vacancy: str):
-        """Производит расчет статистики для требуемой профессии по всем годам.
+        with open(path_to_csv, 'rb') as file:
+            file.seek(begin)
+            chunk = file.read(end - begin).decode("utf-8")
+        statistics = PartialStatistics()
+        DataSet.add_lines_to_statistics(statistics, DataSet.get_chunk_reader(chunk), columns_count, selected_vacancy)
+        return statistics
+
+    def process_statistics_by_chunks(self, selected_vacancy: str, config: "PipelineConfig" = None):
+        """Производит расчет статистики для требуемой профессии, разделяя исходный csv файл на диапазоны байтов и
+        обрабатывая их параллельно.
 
         Args:
             selected_vacancy (str): Профессия, по которой требуется получить статистику
+            config (PipelineConfig): Настройки параллельного расчета статистики
         """
-        with mp.Manager() as manager:
-            salary_by_year = manager.dict()
-            vacancies_count_by_year = manager.dict()
-            selected_vacancy_salary_by_year = manager.dict()
-            selected_vacancy_count_by_year = manager.dict()
-            with concurrent.futures.ProcessPoolExecutor(4) as executor:
-                vacancies = list(self.vacancies_by_year.values())
-                years = list(self.vacancies_by_year.keys())
-                executor.map(DataSet.process_statistics_by_year, vacancies,
-                             itertools.repeat(salary_by_year),
-                             itertools.repeat(vacancies_count_by_year),
-                             itertools.repeat(selected_vacancy_salary_by_year),
-                             itertools.repeat(selected_vacancy_count_by_year),
-                             years,
-                             itertools.repeat(selected_vacancy))
-            self.salary_by_year = dict(salary_by_year)
-            self.vacancies_count_by_year = dict(vacancies_count_by_year)
-            self.selected_vacancy_salary_by_year = dict(selected_vacancy_salary_by_year)
-            self.selected_vacancy_count_by_year = dict(selected_vacancy_count_by_year)
-        vacancies_count = sum([len(self.vacancies_by_year[year]) for year in self.vacancies_by_year])
-        for year in self.vacancies_by_year:
-            for vacancy in self.vacancies_by_year[year]:
-                salary = vacancy.salary.get_rub_average()
-                area = vacancy.area_name
-                if area not in self.salary_by_area:
-                    self.salary_by_area[area] = 0
-                self.salary_by_area[area] += salary
-                if area not in self.vacancies_count_by_area:
-                    self.vacancies_count_by_area[area] = 0
-                self.vacancies_count_by_area[area] += 1
-        for area in self.salary_by_area:
-            self.salary_by_area[area] = int(self.salary_by_area[area] / self.vacancies_count_by_area[area])
+        config = config or PipelineConfig()
+        chunks = DataSet.get_csv_chunks(self.__file_name, config.get_chunk_size(os.path.getsize(self.__file_name)))
+        chunks_statistics, self.worker_timings = config.map(DataSet.get_statistics_by_chunk,
+                                                            itertools.repeat(self.__file_name),
+                                                            [begin for begin, end in chunks],
+                                                            [end for begin, end in chunks],
+                                                            itertools.repeat(len(self.__list_naming)),
+                                                            itertools.repeat(selected_vacancy))
+        statistics = PartialStatistics()
+        for chunk_statistics in chunks_statistics:
+            statistics.merge(chunk_statistics)
+        self.complete_statistics(statistics)
+
+    def complete_statistics(self, statistics: PartialStatistics):
+        """Вычисляет средние зарплаты, доли вакансий по городам и отсортированные словари по объединенной частичной
+        статистике.
+
+        Args:
+            statistics (PartialStatistics): Статистика по всем вакансиям
+        """
+        for year in sorted(statistics.vacancies_count_by_year):
+            vacancies_count_by_year = statistics.vacancies_count_by_year[year]
+            selected_vacancy_count_by_year = statistics.selected_vacancy_count_by_year.get(year, 0)
+            self.salary_by_year[year] = int(statistics.salary_by_year[year] / vacancies_count_by_year)
+            self.vacancies_count_by_year[year] = vacancies_count_by_year
+            self.selected_vacancy_salary_by_year[year] = int(
+                statistics.selected_vacancy_salary_by_year[year] / selected_vacancy_count_by_year) \
+                if selected_vacancy_count_by_year else 0
+            self.selected_vacancy_count_by_year[year] = selected_vacancy_count_by_year
+        vacancies_count = statistics.vacancies_count
+        for area in statistics.vacancies_count_by_area:
+            self.vacancies_count_by_area[area] = statistics.vacancies_count_by_area[area]
+            self.salary_by_area[area] = int(statistics.salary_by_area[area] / self.vacancies_count_by_area[area])
             self.fraction_by_area[area] = round(self.vacancies_count_by_area[area] / vacancies_count, 4)
             if int(self.fraction_by_area[area] * 100) >= 1:
                 self.salary_by_area_appropriate[area] = self.salary_by_area[area]
@@ -424,70 +1236,391 @@ class DataSet:
 
     def csv_reader(self):
         """Открывает файл для чтения и получает названия столбцов csv файла."""
-        vacancies = open(self.__file_name, 'r', encoding="utf-8-sig")
-        self.reader = csv.reader(vacancies)
+        self.file = open(self.__file_name, 'r', encoding="utf-8-sig")
+        self.reader = csv.reader(self.file)
         self.__list_naming = next(self.reader)
 
-    def csv_filter_for_table(self):
+    def csv_reader_mapped(self, columns: list = None):
+        """Открывает файл для чтения с отображением в память и получает названия столбцов csv файла. Строки файла
+        читаются из отображения, значения столбцов, не входящих в требуемые, заменяются на None.
+
+        Args:
+            columns (list): Названия требуемых столбцов, по умолчанию возвращаются все столбцы
+        """
+        self.file = MappedCsvReader(self.__file_name)
+        self.__list_naming = self.file.list_naming
+        self.reader = self.file.read_rows(columns)
+        if not self.__list_naming:
+            raise StopIteration
+
+    def close(self):
+        """Закрывает файл, открытый методом csv_reader или csv_reader_mapped."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def csv_filter_for_table(self, columns: set = None, filter_key: str = None, filter_value: str = None):
         """Считывает вакансии из файла, содержащие все необходимые данные, очищает их от лишних пробелов и html тегов
-         и сохраняет их в список вакансий, а также количество вакансий до фильтрации по параметру."""
+         и сохраняет их в список вакансий, а также количество вакансий до фильтрации по параметру. Если заданы
+         требуемые столбцы, остальные столбцы не очищаются и не преобразуются, а соответствующие поля вакансии равны
+         None. Проверка строки на наличие всех данных по-прежнему выполняется по всем столбцам. Если задан параметр
+         фильтрации и его значение, фильтрация выполняется по очищенному значению одного столбца строки до разбора
+         остальных столбцов, а количество вакансий до фильтрации учитывает все строки с необходимыми данными. Очищаются
+         только столбцы из markup_columns, которые могут содержать html разметку.
+
+        Args:
+            columns (set): Названия требуемых столбцов csv файла, по умолчанию обрабатываются все столбцы
+            filter_key (str): Параметр фильтрации
+            filter_value (str): Значение параметра фильтрации
+        """
+        columns = set(DataSet.table_columns) if columns is None else columns
+        is_salary_required = {"salary_from", "salary_to", "salary_currency"} <= columns
+        predicate = DataSet.get_row_predicate(filter_key, filter_value) if filter_key and filter_value else None
+        self.vacancies_length_before_filtering = 0
         for line in self.reader:
             if len(line) == len(self.__list_naming) and '' not in line:
-                name = DataSet.get_clear_value(line[0])
-                description = DataSet.get_clear_value(line[1])
-                key_skills = DataSet.get_clear_value(line[2]).split('\n')
-                experience_id = DataSet.get_clear_value(line[3])
-                premium = DataSet.get_clear_value(line[4])
-                employer_name = DataSet.get_clear_value(line[5])
-                salary_from = int(float(DataSet.get_clear_value(line[6])))
-                salary_to = int(float(DataSet.get_clear_value(line[7])))
-                salary_gross = DataSet.get_clear_value(line[8])
-                salary_currency = DataSet.get_clear_value(line[9])
+                self.vacancies_length_before_filtering += 1
+                if predicate is not None and not predicate(line):
+                    continue
+                name = DataSet.get_clear_value(line[0]) if "name" in columns else None
+                description = DataSet.get_clear_value(line[1]) if "description" in columns else None
+                key_skills = DataSet.get_clear_value(line[2]).split('\n') if "key_skills" in columns else None
+                experience_id = line[3] if "experience_id" in columns else None
+                premium = line[4] if "premium" in columns else None
+                employer_name = DataSet.get_clear_value(line[5]) if "employer_name" in columns else None
+                salary_from = int(float(line[6])) if "salary_from" in columns else None
+                salary_to = int(float(line[7])) if "salary_to" in columns else None
+                salary_gross = line[8] if "salary_gross" in columns else None
+                salary_currency = line[9] if "salary_currency" in columns else None
                 salary = Salary(salary_from, salary_to, salary_currency, salary_gross)
-                area_name = DataSet.get_clear_value(line[10])
-                published_at = DataSet.get_clear_value(line[11])
+                area_name = DataSet.get_clear_value(line[10]) if "area_name" in columns else None
+                published_at = line[11] if "published_at" in columns else None
                 vacancy = Vacancy(name, salary, area_name, published_at, description, key_skills, experience_id, premium, employer_name)
-                salary.rub_average = salary.get_rub_average()
+                if is_salary_required:
+                    salary.rub_average = salary.get_rub_average()
                 self.vacancies.append(vacancy)
-        self.vacancies_length_before_filtering = len(self.vacancies)
+
+    @staticmethod
+    def get_row_predicate(filter_key: str, filter_value: str):
+        """Возвращает функцию проверки строки csv файла на соответствие значению параметра фильтрации. Функция очищает
+        (если он может содержать html разметку) и преобразует только столбец, по которому выполняется фильтрация, и
+        проверяет его так же, как check_vacancy.
+
+        Args:
+            filter_key (str): Параметр фильтрации
+            filter_value (str): Значение параметра фильтрации
+
+        Returns:
+            function: Функция, принимающая строку csv файла и возвращающая True, если строка соответствует фильтру
+
+        >>> line = ["Программист", "", "Python\\nGit", "between1And3", "True", "", "20000.0", "30000.0", "", "RUR",
+        ...         "<b>Москва</b>", "2022-11-23T00:00:00+0300"]
+        >>> DataSet.get_row_predicate("Название региона", "Москва")(line)
+        True
+        >>> DataSet.get_row_predicate("Навыки", "Git, SQL")(line)
+        False
+        >>> DataSet.get_row_predicate("Оклад", "25000")(line)
+        True
+        >>> DataSet.get_row_predicate("Дата публикации вакансии", "23.11.2022")(line)
+        True
+        """
+        get_clear_value = DataSet.get_clear_value
+        if filter_key == "Название":
+            return lambda line: get_clear_value(line[0]) == filter_value
+        elif filter_key == "Описание":
+            return lambda line: get_clear_value(line[1]) == filter_value
+        elif filter_key == "Навыки":
+            filter_skills = filter_value.split(", ")
+            return lambda line: all(filter_skill in get_clear_value(line[2]).split('\n')
+                                    for filter_skill in filter_skills)
+        elif filter_key == "Опыт работы":
+            return lambda line: InputConnect.experience_naming[line[3]] == filter_value
+        elif filter_key == "Премиум-вакансия":
+            return lambda line: filter_value == ("Да" if line[4] == "True" else "Нет")
+        elif filter_key == "Компания":
+            return lambda line: get_clear_value(line[5]) == filter_value
+        elif filter_key == "Оклад":
+            salary_value = int(filter_value)
+            return lambda line: float(int(float(line[6]))) <= salary_value <= float(int(float(line[7])))
+        elif filter_key == "Название региона":
+            return lambda line: get_clear_value(line[10]) == filter_value
+        elif filter_key == "Дата публикации вакансии":
+            return lambda line: Vacancy.convert_str_to_datetime_using_string_parsing(
+                line[11]).strftime("%d.%m.%Y") == filter_value
+        elif filter_key == "Идентификатор валюты оклада":
+            return lambda line: InputConnect.currency_naming[line[9]] == filter_value
+        return lambda line: False
+
+    @staticmethod
+    def get_required_columns(columns_to_print: list, filter_key: str = None, sorting_parameters: list = ()):
+        """Возвращает названия столбцов csv файла, необходимых для вывода требуемых столбцов таблицы, фильтрации и
+        сортировки.
+
+        Args:
+            columns_to_print (list): Требуемые столбцы для вывода таблицы
+            filter_key (str): Параметр фильтрации
+            sorting_parameters (list): Параметры сортировки
+
+        Returns:
+            set: Названия столбцов csv файла
+
+        >>> sorted(DataSet.get_required_columns(["Название"], "Название региона", ["Оклад"]))
+        ['area_name', 'name', 'salary_currency', 'salary_from', 'salary_gross', 'salary_to']
+        """
+        columns = set()
+        for parameter in list(columns_to_print) + [filter_key] + list(sorting_parameters):
+            columns.update(DataSet.columns_by_parameter.get(parameter, []))
+        return columns
+
+    def csv_filter_to_frame(self, columns: list = None):
+        """Считывает вакансии из файла, содержащие все необходимые данные, очищает их от лишних пробелов и html тегов
+         и сохраняет их в колоночном представлении, а также количество вакансий до фильтрации по параметру.
+
+        Args:
+            columns (list): Категориальные столбцы, которые требуется сохранить, по умолчанию сохраняются все
+        """
+        self.vacancy_frame = VacancyFrame.from_rows(self.reader, self.__list_naming, clear_values=True, columns=columns)
+        self.vacancies_length_before_filtering = len(self.vacancy_frame)
+
+    def get_statistics_from_frame(self, selected_vacancy: str):
+        """Производит расчет статистики по требуемой профессии векторными операциями над колоночным представлением
+        вакансий.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        frame = self.vacancy_frame
+        years, year_codes = np.unique(frame.get_years(), return_inverse=True)
+        salary_sums = np.bincount(year_codes, weights=frame.rub_average, minlength=len(years))
+        counts = np.bincount(year_codes, minlength=len(years))
+        if selected_vacancy != '':
+            selected_mask = frame.get_category_mask("name", lambda name: selected_vacancy in name)
+        else:
+            selected_mask = np.zeros(len(frame), dtype=bool)
+        selected_salary_sums = np.bincount(year_codes[selected_mask], weights=frame.rub_average[selected_mask],
+                                           minlength=len(years))
+        selected_counts = np.bincount(year_codes[selected_mask], minlength=len(years))
+        for i, year in enumerate(years.tolist()):
+            self.salary_by_year[year] = int(salary_sums[i] / counts[i])
+            self.vacancies_count_by_year[year] = int(counts[i])
+            self.selected_vacancy_salary_by_year[year] = int(selected_salary_sums[i] / selected_counts[i]) \
+                if selected_counts[i] else 0
+            self.selected_vacancy_count_by_year[year] = int(selected_counts[i])
+        area_codes = frame.codes["area_name"]
+        area_salary_sums = np.bincount(area_codes, weights=frame.rub_average, minlength=len(frame.categories["area_name"]))
+        area_counts = np.bincount(area_codes, minlength=len(frame.categories["area_name"]))
+        for area_code in np.flatnonzero(area_counts).tolist():
+            area = frame.categories["area_name"][area_code]
+            self.vacancies_count_by_area[area] = int(area_counts[area_code])
+            self.salary_by_area[area] = int(area_salary_sums[area_code] / area_counts[area_code])
+            self.fraction_by_area[area] = round(self.vacancies_count_by_area[area] / len(frame), 4)
+            if int(self.fraction_by_area[area] * 100) >= 1:
+                self.salary_by_area_appropriate[area] = self.salary_by_area[area]
+                self.fraction_by_area_appropriate[area] = self.fraction_by_area[area]
+        self.salary_by_area_appropriate = {k: v for k, v in
+                                           sorted(self.salary_by_area_appropriate.items(), key=lambda item: item[1],
+                                                  reverse=True)}
+        self.fraction_by_area_appropriate = {k: v for k, v in
+                                             sorted(self.fraction_by_area_appropriate.items(), key=lambda item: item[1],
+                                                    reverse=True)}
+        self.salary_by_area_sliced = dict(itertools.islice(self.salary_by_area_appropriate.items(), 10))
+        self.fraction_by_area_sliced = dict(itertools.islice(self.fraction_by_area_appropriate.items(), 10))
 
     def formatter(self, filter_key=None, filter_value=None):
-        """Выполняет фильтрацию списка вакансий, если задан параметр фильтрации и его значение.
+        """Выполняет фильтрацию списка вакансий (или колоночного представления вакансий, если данные считаны в него),
+        если задан параметр фильтрации и его значение.
 
         Args:
             filter_key (str): Параметр фильтрации
             filter_value (str): Значение параметра фильтрации
         """
-        if filter_key and filter_value:
-            self.vacancies = list(
-                filter(lambda vacancy: DataSet.check_vacancy(vacancy, filter_key, filter_value), self.vacancies))
+        if filter_key and filter_value and self.vacancy_frame is not None:
+            self.vacancy_frame = self.vacancy_frame.filter(filter_key, filter_value)
+        elif filter_key and filter_value:
+            self.vacancies = self.select_vacancies(filter_key, filter_value)
+            self.indexes = {}
 
-    def sorter(self, sorting_parameter=None, reverse_sort=False):
-        """Выполняет сортировку списка вакансий, если задан параметр сортировки.
+    def get_index(self, filter_key: str):
+        """Возвращает индекс списка вакансий для параметра фильтрации: словарь, где ключ - значение столбца, а
+        значение - список номеров вакансий с этим значением в порядке списка. Индекс строится при первом обращении и
+        используется повторно, пока список вакансий не изменится.
 
         Args:
-            sorting_parameter (str): Параметр сортировки
-            reverse_sort (bool): Флаг сортировки в обратном порядке (True, если требуется отсортировать в обратном порядке)
-        """
-        if sorting_parameter:
-            if sorting_parameter == "Название":
-                self.vacancies.sort(key=lambda v: v.name, reverse=reverse_sort)
-            elif sorting_parameter == "Описание":
-                self.vacancies.sort(key=lambda v: v.description, reverse=reverse_sort)
-            elif sorting_parameter == "Навыки":
-                self.vacancies.sort(key=lambda v: len(v.key_skills), reverse=reverse_sort)
-            elif sorting_parameter == "Опыт работы":
-                self.vacancies.sort(key=lambda v: self.convert_experience_to_int(v.experience_id), reverse=reverse_sort)
-            elif sorting_parameter == "Премиум-вакансия":
-                self.vacancies.sort(key=lambda v: v.premium, reverse=reverse_sort)
-            elif sorting_parameter == "Компания":
-                self.vacancies.sort(key=lambda v: v.employer_name, reverse=reverse_sort)
-            elif sorting_parameter == "Оклад":
-                self.vacancies.sort(key=lambda v: v.salary.rub_average, reverse=reverse_sort)
-            elif sorting_parameter == "Название региона":
-                self.vacancies.sort(key=lambda v: v.area_name, reverse=reverse_sort)
-            elif sorting_parameter == "Дата публикации вакансии":
-                self.vacancies.sort(key=lambda v: v.published_at, reverse=reverse_sort)
+            filter_key (str): Параметр фильтрации из index_keys
+
+        Returns:
+            dict: Индекс списка вакансий
+        """
+        index = self.indexes.get(filter_key)
+        if index is None:
+            index = {}
+            key = DataSet.index_keys[filter_key]
+            for i, vacancy in enumerate(self.vacancies):
+                index.setdefault(key(vacancy), []).append(i)
+            self.indexes[filter_key] = index
+        return index
+
+    def get_salary_tree(self):
+        """Возвращает дерево интервалов вилок оклада списка вакансий. Дерево строится при первом обращении и
+        используется повторно, пока список вакансий не изменится, в том числе всеми запросами по окладу в
+        InputConnect.run_session.
+
+        Returns:
+            SalaryIntervalTree: Дерево интервалов вилок оклада
+        """
+        tree = self.indexes.get("Оклад")
+        if tree is None:
+            tree = SalaryIntervalTree([(vacancy.salary.salary_from, vacancy.salary.salary_to, i)
+                                       for i, vacancy in enumerate(self.vacancies)])
+            self.indexes["Оклад"] = tree
+        return tree
+
+    def select_vacancies_by_salary_range(self, salary_from: int, salary_to: int):
+        """Возвращает вакансии, вилка оклада которых пересекается с диапазоном, включая границы, не изменяя список
+        вакансий.
+
+        Args:
+            salary_from (int): Нижняя граница диапазона
+            salary_to (int): Верхняя граница диапазона
+
+        Returns:
+            list: Вакансии в порядке списка вакансий
+        """
+        return [self.vacancies[i] for i in sorted(self.get_salary_tree().overlap(salary_from, salary_to))]
+
+    def select_vacancies(self, filter_key: str, filter_value: str):
+        """Возвращает вакансии, соответствующие значению параметра фильтрации, не изменяя список вакансий. Используется
+        для повторных запросов к загруженным вакансиям в InputConnect.run_session. Для параметров из index_keys
+        вакансии выбираются по индексу, для параметра "Оклад" - по дереву интервалов вилок оклада, для остальных
+        параметров проверяется каждая вакансия.
+
+        Args:
+            filter_key (str): Параметр фильтрации
+            filter_value (str): Значение параметра фильтрации
+
+        Returns:
+            list: Вакансии, соответствующие фильтру, в порядке списка вакансий
+
+        >>> data_set = DataSet("vacancies.csv")
+        >>> data_set.vacancies = [Vacancy("Программист", Salary(20000, 30000, "RUR", "True"), "Москва",
+        ...                               "2022-11-23T00:00:00+0300", employer_name="Яндекс"),
+        ...                       Vacancy("Аналитик", Salary(1000, 2000, "USD", "True"), "Казань",
+        ...                               "2022-11-24T00:00:00+0300", employer_name="Яндекс")]
+        >>> [vacancy.name for vacancy in data_set.select_vacancies("Компания", "Яндекс")]
+        ['Программист', 'Аналитик']
+        >>> [vacancy.name for vacancy in data_set.select_vacancies("Идентификатор валюты оклада", "Доллары")]
+        ['Аналитик']
+        >>> [vacancy.name for vacancy in data_set.select_vacancies("Оклад", "25000")]
+        ['Программист']
+        >>> sorted(data_set.indexes)
+        ['Идентификатор валюты оклада', 'Компания', 'Оклад']
+        """
+        if filter_key in DataSet.index_keys:
+            return [self.vacancies[i] for i in self.get_index(filter_key).get(filter_value, [])]
+        if filter_key == "Оклад":
+            return [self.vacancies[i] for i in sorted(self.get_salary_tree().stab(int(filter_value)))]
+        return [vacancy for vacancy in self.vacancies if DataSet.check_vacancy(vacancy, filter_key, filter_value)]
+
+    def sorter(self, sorting_parameter=None, reverse_sort=False, limit: int = None):
+        """Выполняет сортировку списка вакансий (или колоночного представления вакансий, если данные считаны в него),
+        если задан параметр сортировки. Можно задать список параметров: тогда вакансии сортируются по первому
+        параметру, при равенстве - по второму и так далее. Для этого выполняются устойчивые сортировки по каждому
+        параметру, начиная с последнего. Ключ сортировки вычисляется один раз для каждой вакансии. Если задано
+        количество вакансий, остаются только первые вакансии в порядке сортировки, которые выбираются частичной
+        сортировкой на куче без сортировки всего списка.
+
+        Args:
+            sorting_parameter: Параметр сортировки или список параметров
+            reverse_sort: Флаг сортировки в обратном порядке (True, если требуется отсортировать в обратном порядке)
+            или список флагов для каждого параметра
+            limit (int): Количество первых вакансий, которые требуется оставить
+        """
+        if self.vacancy_frame is not None:
+            for parameter, reverse in reversed(DataSet.get_sorting_specs(sorting_parameter, reverse_sort)):
+                self.vacancy_frame = self.vacancy_frame.sort(parameter, reverse)
+            if limit is not None and limit < len(self.vacancy_frame):
+                self.vacancy_frame = self.vacancy_frame.take(np.arange(max(limit, 0)))
+            return
+        self.vacancies = DataSet.sort_vacancies(self.vacancies, sorting_parameter, reverse_sort, limit)
+        self.indexes = {}
+
+    @staticmethod
+    def get_sorting_specs(sorting_parameter=None, reverse_sort=False):
+        """Возвращает пары параметра сортировки и флага сортировки в обратном порядке, пропуская пустые параметры.
+
+        Args:
+            sorting_parameter: Параметр сортировки или список параметров
+            reverse_sort: Флаг сортировки в обратном порядке или список флагов для каждого параметра
+
+        Returns:
+            list: Пары параметра сортировки и флага сортировки в обратном порядке
+
+        >>> DataSet.get_sorting_specs(["Оклад", "", "Название"], True)
+        [('Оклад', True), ('Название', True)]
+        """
+        sorting_parameters = [sorting_parameter] if isinstance(sorting_parameter, str) else list(sorting_parameter or [])
+        reverse_sorts = list(reverse_sort) if isinstance(reverse_sort, (list, tuple)) \
+            else [reverse_sort] * len(sorting_parameters)
+        return [(parameter, reverse) for parameter, reverse in zip(sorting_parameters, reverse_sorts) if parameter]
+
+    @staticmethod
+    def sort_vacancies(vacancies: list, sorting_parameter=None, reverse_sort=False, limit: int = None):
+        """Сортирует список вакансий так же, как sorter. Если количество вакансий не задано, список сортируется на месте.
+
+        Args:
+            vacancies (list): Список вакансий
+            sorting_parameter: Параметр сортировки или список параметров
+            reverse_sort: Флаг сортировки в обратном порядке или список флагов для каждого параметра
+            limit (int): Количество первых вакансий, которые требуется оставить
+
+        Returns:
+            list: Отсортированный список вакансий или первые вакансии в порядке сортировки
+        """
+        sorting_specs = [(DataSet.sort_keys[parameter], reverse) for parameter, reverse in
+                         DataSet.get_sorting_specs(sorting_parameter, reverse_sort) if parameter in DataSet.sort_keys]
+        if limit is not None and limit < len(vacancies):
+            return DataSet.select_first(vacancies, sorting_specs, max(limit, 0))
+        for sort_key, reverse in reversed(sorting_specs):
+            vacancies.sort(key=sort_key, reverse=reverse)
+        return vacancies
+
+    @staticmethod
+    def select_first(vacancies: list, sorting_specs: list, limit: int):
+        """Возвращает первые вакансии в порядке устойчивой сортировки. Если все ключи сортируются в одном направлении,
+        вакансии выбираются на куче размера limit за O(n log limit), иначе сортируется весь список.
+
+        Args:
+            vacancies (list): Список вакансий
+            sorting_specs (list): Список пар функции ключа сортировки и флага сортировки в обратном порядке
+            limit (int): Количество вакансий
+
+        Returns:
+            list: Первые вакансии в порядке сортировки
+
+        >>> DataSet.select_first([3, 1, 2, 1], [(abs, True)], 2)
+        [3, 2]
+        """
+        if not sorting_specs:
+            return vacancies[:limit]
+        if any(reverse != sorting_specs[0][1] for _, reverse in sorting_specs):
+            vacancies = list(vacancies)
+            for sort_key, reverse in reversed(sorting_specs):
+                vacancies.sort(key=sort_key, reverse=reverse)
+            return vacancies[:limit]
+        if len(sorting_specs) == 1:
+            sort_key = sorting_specs[0][0]
+        else:
+            sort_keys = [sort_key for sort_key, _ in sorting_specs]
+            sort_key = lambda vacancy: tuple(key(vacancy) for key in sort_keys)
+        if sorting_specs[0][1]:
+            return heapq.nlargest(limit, vacancies, key=sort_key)
+        return heapq.nsmallest(limit, vacancies, key=sort_key)
 
     def convert_experience_to_int(self, experience: str):
         """Преобразует требуемый опыт в число, используемое для дальнейшего сравнения.
@@ -498,14 +1631,7 @@ class DataSet:
         Returns:
             int: Опыт работы в виде числа
         """
-        if experience == "noExperience":
-            return 0
-        elif experience == "between1And3":
-            return 1
-        elif experience == "between3And6":
-            return 2
-        else:
-            return 3
+        return VacancyFrame.experience_order.get(experience, 3)
 
     @staticmethod
     def check_vacancy(vacancy: "Vacancy", filter_key, filter_value):
@@ -571,9 +1697,15 @@ class InputConnect:
         currency_naming (dict): (class attribute) Словарь для перевода идентификатора валюты оклада на русский
         valid_keys (list): (class attribute) Корректные названия параметров для фильтрации и сортировки
         columns (list): (class attribute) Столбцы для вывода таблицы
+        table_max_width (int): (class attribute) Максимальная ширина столбца таблицы
+        table_chunk_size (int): (class attribute) Количество строк таблицы, выводимых за один раз
+        config (PipelineConfig): Настройки параллельного расчета статистики
+        use_mapped_reader (bool): Флаг чтения файла с отображением в память
+        interactive (bool): Флаг повторных запросов фильтрации к однажды загруженным вакансиям
         csv_file_name (str): Имя csv файла
         filter_parameter (list): Параметр фильтрации и его значение
         sorting_parameter (list): Параметр сортировки и его значение
+        sorting_parameters (list): Параметры сортировки, перечисленные через запятую
         is_sorting_parameter_reverse (bool): Флаг сортировки в обратном порядке
         vacancy_range (list): Диапазон вывода
         columns_to_print (list): Требуемые столбцы для вывода таблицы
@@ -598,42 +1730,227 @@ class InputConnect:
                   'Дата публикации вакансии', 'Оклад']
     columns = ["Название", "Описание", "Навыки", "Опыт работы", "Премиум-вакансия", "Компания", "Оклад",
                "Название региона", "Дата публикации вакансии"]
+    table_max_width = 20
+    table_chunk_size = 1000
 
-    def print_vacancies_table(self, vacancies, vacancy_from, vacancy_to, columns_to_print):
-        """Печатает таблицу с вакансиями на экран.
+    def print_query(self, data_set: DataSet, vacancies: list):
+        """Сортирует отфильтрованные вакансии и печатает таблицу с вакансиями из введенного пользователем диапазона или
+        сообщение о том, что вакансий нет.
 
         Args:
-            vacancies (list): Список вакансий для печати
-            vacancy_from (int): Нижняя граница диапазона вывода
-            vacancy_to (int): Верхняя граница диапазона вывода
+            data_set (DataSet): Данные вакансий
+            vacancies (list): Отфильтрованный список вакансий, который может быть отсортирован на месте
+        """
+        if len(self.vacancy_range) == 0:
+            vacancy_from = 0
+            vacancy_to = data_set.vacancies_length_before_filtering
+        elif len(self.vacancy_range) == 1:
+            vacancy_from = self.vacancy_range[0]
+            vacancy_to = data_set.vacancies_length_before_filtering
+        else:
+            vacancy_from, vacancy_to = self.vacancy_range
+        if len(vacancies) == 0:
+            if data_set.vacancies_length_before_filtering != 0:
+                print("Ничего не найдено")
+            else:
+                print("Нет данных")
+            return
+        columns_to_print = self.columns if self.columns_to_print == [''] else self.columns_to_print
+        start, end = InputConnect.get_window(vacancy_from, vacancy_to, len(vacancies))
+        vacancies = DataSet.sort_vacancies(vacancies, self.sorting_parameters, self.is_sorting_parameter_reverse, end)
+        self.print_vacancies_table(vacancies, start, end, columns_to_print)
+
+    def run_session(self, data_set: DataSet, filter_key: str = None, filter_value: str = None):
+        """Выводит результаты запросов фильтрации к загруженным вакансиям, пока пользователь не введет пустой параметр
+        фильтрации. Список вакансий DataSet не изменяется, поэтому индексы по региону, компании, валюте и окладу
+        строятся при первом запросе по параметру и используются всеми следующими запросами.
+
+        Args:
+            data_set (DataSet): Данные вакансий, загруженные целиком
+            filter_key (str): Параметр фильтрации первого запроса
+            filter_value (str): Значение параметра фильтрации первого запроса
+        """
+        while True:
+            if filter_key and filter_value:
+                self.print_query(data_set, data_set.select_vacancies(filter_key, filter_value))
+            else:
+                self.print_query(data_set, list(data_set.vacancies))
+            filter_key, filter_value = None, None
+            while filter_key is None:
+                try:
+                    filter_parameter = input("Введите параметр фильтрации: ").split(": ")
+                except EOFError:
+                    return
+                if filter_parameter == ['']:
+                    return
+                elif len(filter_parameter) != 2:
+                    print("Формат ввода некорректен")
+                elif filter_parameter[0] not in InputConnect.valid_keys:
+                    print("Параметр поиска некорректен")
+                else:
+                    filter_key, filter_value = filter_parameter
+
+    def print_vacancies_table(self, vacancies, start, end, columns_to_print):
+        """Печатает таблицу с вакансиями из диапазона на экран. Строки таблицы создаются только для вакансий из
+        диапазона, номера строк совпадают с номерами вакансий в отсортированном списке. Таблица выводится частями по
+        table_chunk_size строк, поэтому в памяти не хранится вся отрисованная таблица. Ширина столбцов вычисляется
+        заранее по всему диапазону, чтобы части таблицы совпадали по ширине.
+
+        Args:
+            vacancies (list): Список отсортированных вакансий, содержащий как минимум вакансии диапазона
+            start (int): Индекс первой вакансии диапазона
+            end (int): Индекс, следующий за последней вакансией диапазона
             columns_to_print (list): Требуемые столбцы для вывода таблицы
         """
+        columns = [column for column in self.columns if column in columns_to_print]
+        field_names = ['№'] + columns
+        widths = self.get_column_widths(field_names, self.get_table_rows(vacancies, start, end, columns))
+        for chunk_start in range(start, max(start + 1, end), self.table_chunk_size):
+            table = self.create_table(field_names, widths)
+            for row in self.get_table_rows(vacancies, chunk_start, min(chunk_start + self.table_chunk_size, end),
+                                           columns):
+                table.add_row(row)
+            if chunk_start == start:
+                print(table.get_string())
+            else:
+                print(table.get_string(header=False).split('\n', 1)[1])
+
+    def get_table_rows(self, vacancies, start, end, columns):
+        """Создает строки таблицы для вакансий из диапазона.
+
+        Args:
+            vacancies (list): Список отсортированных вакансий, содержащий как минимум вакансии диапазона
+            start (int): Индекс первой вакансии диапазона
+            end (int): Индекс, следующий за последней вакансией диапазона
+            columns (list): Столбцы таблицы без столбца номера
+
+        Returns:
+            generator: Генератор строк таблицы
+        """
+        for i in range(start, end):
+            vacancy = vacancies[i]
+            yield [str(i + 1)] + [self.get_column_value(vacancy, column) for column in columns]
+
+    @staticmethod
+    def get_column_widths(field_names: list, rows):
+        """Вычисляет ширину столбцов таблицы так же, как PrettyTable: по ширине заголовка и самой длинной строки
+        значения, но не больше максимальной ширины столбца.
+
+        Args:
+            field_names (list): Заголовки столбцов
+            rows: Итерируемый объект строк таблицы
+
+        Returns:
+            dict: Словарь, где ключ - заголовок столбца, а значение - его ширина
+
+        >>> InputConnect.get_column_widths(['№', 'Название'], [['1', 'Программист'], ['10', 'Очень длинное название']])
+        {'№': 2, 'Название': 20}
+        """
+        widths = [InputConnect.get_text_width(field) for field in field_names]
+        for row in rows:
+            for i, value in enumerate(row):
+                widths[i] = max(widths[i], min(InputConnect.get_text_width(value), InputConnect.table_max_width))
+        return dict(zip(field_names, widths))
+
+    @staticmethod
+    def get_text_width(text: str):
+        """Возвращает ширину текста при выводе в терминал, равную ширине самой длинной строки текста.
+
+        Args:
+            text (str): Текст
+
+        Returns:
+            int: Ширина текста
+
+        >>> InputConnect.get_text_width("Нет опыта")
+        9
+        """
+        widths = [wcwidth.wcswidth(line) for line in text.split('\n')]
+        return max(width if width >= 0 else len(line) for width, line in zip(widths, text.split('\n')))
+
+    @staticmethod
+    def create_table(field_names: list, widths: dict):
+        """Создает пустую таблицу с заданными заголовками и минимальной шириной столбцов.
+
+        Args:
+            field_names (list): Заголовки столбцов
+            widths (dict): Словарь, где ключ - заголовок столбца, а значение - его минимальная ширина
+
+        Returns:
+            prettytable.PrettyTable: Таблица без строк
+        """
         table = prettytable.PrettyTable()
-        table.field_names = ['№'] + self.columns
-        table.max_width = 20
+        table.field_names = field_names
+        table.max_width = InputConnect.table_max_width
+        table.min_width = widths
         table.align = 'l'
         table.hrules = prettytable.ALL
+        return table
+
+    @staticmethod
+    def get_window(vacancy_from: int, vacancy_to: int, vacancies_count: int):
+        """Переводит введенный пользователем диапазон вывода в индексы первой и следующей за последней вакансий
+        диапазона. Номер первой вакансии отсчитывается от 1, номер последней не включается в диапазон, если он не равен
+        количеству вакансий.
+
+        Args:
+            vacancy_from (int): Нижняя граница диапазона вывода
+            vacancy_to (int): Верхняя граница диапазона вывода
+            vacancies_count (int): Количество вакансий
+
+        Returns:
+            tuple: Индексы первой и следующей за последней вакансий диапазона
+
+        >>> InputConnect.get_window(3, 10, 100)
+        (2, 9)
+        >>> InputConnect.get_window(0, 100, 100)
+        (0, 100)
+        >>> InputConnect.get_window(5, 3, 100)
+        (4, 4)
+        >>> InputConnect.get_window(0, 0, 100)
+        Traceback (most recent call last):
+        ...
+        ValueError: Диапазон вывода задан некорректно
+        """
         if vacancy_from > 0:
             vacancy_from -= 1
-        if vacancy_to != len(vacancies):
+        if vacancy_to != vacancies_count:
             vacancy_to -= 1
-        for i in range(len(vacancies)):
-            vacancy = vacancies[i]
-            result_row = [str(i + 1)]
-            result_row.append(self.shorten_string(vacancy.name))
-            result_row.append(self.shorten_string(vacancy.description))
-            result_row.append(self.shorten_string('\n'.join(vacancy.key_skills)))
-            result_row.append(InputConnect.experience_naming[vacancy.experience_id])
-            result_row.append("Да" if vacancy.premium else "Нет")
-            result_row.append(vacancy.employer_name)
+        if vacancy_from < 0 or vacancy_to < 0:
+            raise ValueError("Диапазон вывода задан некорректно")
+        start = min(vacancy_from, vacancies_count)
+        return start, max(start, min(vacancy_to, vacancies_count))
+
+    def get_column_value(self, vacancy: Vacancy, column: str):
+        """Возвращает значение столбца таблицы для вакансии.
+
+        Args:
+            vacancy (Vacancy): Вакансия
+            column (str): Столбец таблицы
+
+        Returns:
+            str: Значение столбца
+        """
+        if column == "Название":
+            return self.shorten_string(vacancy.name)
+        elif column == "Описание":
+            return self.shorten_string(vacancy.description)
+        elif column == "Навыки":
+            return self.shorten_string('\n'.join(vacancy.key_skills))
+        elif column == "Опыт работы":
+            return InputConnect.experience_naming[vacancy.experience_id]
+        elif column == "Премиум-вакансия":
+            return "Да" if vacancy.premium else "Нет"
+        elif column == "Компания":
+            return vacancy.employer_name
+        elif column == "Оклад":
             salary_gross = InputConnect.salary_gross_naming[vacancy.salary.salary_gross.lower()]
             salary_currency = InputConnect.currency_naming[vacancy.salary.salary_currency]
-            salary = f"{format(vacancy.salary.salary_from, ',').replace(',', ' ')} - {format(vacancy.salary.salary_to, ',').replace(',', ' ')} ({salary_currency}) ({salary_gross})"
-            result_row.append(salary)
-            result_row.append(vacancy.area_name)
-            result_row.append(vacancy.published_at.strftime("%d.%m.%Y"))
-            table.add_row(result_row)
-        print(table.get_string(start=vacancy_from, end=vacancy_to, fields=['№'] + list(columns_to_print)))
+            return f"{format(vacancy.salary.salary_from, ',').replace(',', ' ')} - {format(vacancy.salary.salary_to, ',').replace(',', ' ')} ({salary_currency}) ({salary_gross})"
+        elif column == "Название региона":
+            return vacancy.area_name
+        elif column == "Дата публикации вакансии":
+            return vacancy.published_at.strftime("%d.%m.%Y")
 
     def print_statistics(self, data_set: DataSet):
         """Печатает статистику на экран.
@@ -651,6 +1968,20 @@ class InputConnect:
         print(
             f"Доля вакансий по городам (в порядке убывания): {data_set.fraction_by_area_sliced}")
 
+    def print_worker_timings(self, data_set: DataSet):
+        """Печатает на экран количество обработанных частей и суммарное время работы каждого исполнителя.
+
+        Args:
+            data_set (DataSet): Дата-сет статистики
+        """
+        timings_by_worker = {}
+        for timing in data_set.worker_timings:
+            worker = (timing["pid"], timing["thread"])
+            tasks_count, seconds = timings_by_worker.get(worker, (0, 0))
+            timings_by_worker[worker] = (tasks_count + 1, seconds + timing["seconds"])
+        for (pid, thread), (tasks_count, seconds) in timings_by_worker.items():
+            print(f"Исполнитель {pid} ({thread}): частей {tasks_count}, время {seconds:.3f} с")
+
     def shorten_string(self, s):
         """Возвращает укороченную до 100-и символов строку, если её длина превышает 100 символов, иначе исходную строку.
 
@@ -671,6 +2002,7 @@ class InputConnect:
         if self.output_type == "Вакансии":
             self.filter_parameter = input("Введите параметр фильтрации: ").split(": ")
             self.sorting_parameter = input("Введите параметр сортировки: ")
+            self.sorting_parameters = self.sorting_parameter.split(", ") if self.sorting_parameter else []
             self.is_sorting_parameter_reverse = input("Обратный порядок сортировки (Да / Нет): ")
             if self.is_sorting_parameter_reverse == "Да":
                 self.is_sorting_parameter_reverse = True
@@ -695,7 +2027,7 @@ class InputConnect:
             elif self.filter_key not in InputConnect.valid_keys and self.filter_key != '':
                 print("Параметр поиска некорректен")
                 return False
-            elif self.sorting_parameter not in InputConnect.valid_keys and self.sorting_parameter != '':
+            elif any(parameter not in InputConnect.valid_keys for parameter in self.sorting_parameters):
                 print("Параметр сортировки некорректен")
                 return False
             elif self.is_sorting_parameter_reverse not in (True, False):
@@ -709,51 +2041,63 @@ class InputConnect:
         return False
 
     @profile
-    def __init__(self):
+    def __init__(self, config: PipelineConfig = None, use_mapped_reader: bool = False, interactive: bool = False):
         """Инициализирует объект класса InputConnect и обрабатывает данные вакансий при корректности введенных
-        пользователем данных."""
+        пользователем данных. В режиме повторных запросов таблица вакансий загружается один раз целиком, после чего
+        выводятся результаты первого и всех следующих запросов фильтрации.
+
+        Args:
+            config (PipelineConfig): Настройки параллельного расчета статистики
+            use_mapped_reader (bool): Флаг чтения файла с отображением в память
+            interactive (bool): Флаг повторных запросов фильтрации к однажды загруженным вакансиям
+        """
+        self.config = config or PipelineConfig()
+        self.use_mapped_reader = use_mapped_reader
+        self.interactive = interactive
         self.ask_user()
         if self.check_input():
             data_set = DataSet(self.csv_file_name)
+            required_columns, vacancy_columns = None, None
+            filter_key, filter_value = None, None
+            if self.output_type == "Вакансии":
+                if len(self.filter_parameter) == 2 and self.filter_key in InputConnect.valid_keys:
+                    filter_key, filter_value = self.filter_parameter
+                if not self.interactive:
+                    columns_to_print = self.columns if self.columns_to_print == [''] else self.columns_to_print
+                    required_columns = DataSet.get_required_columns(columns_to_print, self.filter_key,
+                                                                    self.sorting_parameters)
+                    vacancy_columns = DataSet.get_required_columns(columns_to_print, None, self.sorting_parameters)
             try:
-                data_set.csv_reader()
+                if self.use_mapped_reader:
+                    data_set.csv_reader_mapped(required_columns)
+                else:
+                    data_set.csv_reader()
             except StopIteration:
                 print("Пустой файл")
             if not data_set.is_empty_file():
                 if self.output_type == "Вакансии":
-                    data_set.csv_filter_for_table()
-                    if len(self.filter_parameter) == 2:
-                        filter_key, filter_value = self.filter_parameter
-                        if filter_key in InputConnect.valid_keys:
-                            data_set.formatter(filter_key, filter_value)
-                    if len(self.vacancy_range) == 0:
-                        vacancy_from = 0
-                        vacancy_to = data_set.vacancies_length_before_filtering
-                    elif len(self.vacancy_range) == 1:
-                        vacancy_from = self.vacancy_range[0]
-                        vacancy_to = data_set.vacancies_length_before_filtering
+                    if self.interactive:
+                        data_set.csv_filter_for_table()
+                        self.run_session(data_set, filter_key, filter_value)
                     else:
-                        vacancy_from, vacancy_to = self.vacancy_range
-                    if len(self.columns_to_print) == 1 and self.columns_to_print[0] == '':
-                        if len(data_set.vacancies) != 0:
-                            self.columns_to_print = self.columns
-                        else:
-                            self.columns_to_print = []
-                    if len(data_set.vacancies) == 0:
-                        if data_set.vacancies_length_before_filtering != 0:
-                            print("Ничего не найдено")
-                        else:
-                            print("Нет данных")
-                    else:
-                        data_set.sorter(self.sorting_parameter, self.is_sorting_parameter_reverse)
-                        self.print_vacancies_table(data_set.vacancies, vacancy_from, vacancy_to, self.columns_to_print)
+                        data_set.csv_filter_for_table(vacancy_columns, filter_key, filter_value)
+                        self.print_query(data_set, data_set.vacancies)
                 elif self.output_type == "Статистика":
-                    csv_splitter.split_csv_by_year(self.csv_file_name, "./splitted_csv/", "published_at")
-                    data_set.csv_reader_all_years()
-                    if len(data_set.vacancies_by_year) == 0:
+                    if self.config.ingestion_mode == "years":
+                        os.makedirs(self.config.scratch_dir, exist_ok=True)
+                        csv_splitter.split_csv_by_year(self.csv_file_name, join(self.config.scratch_dir, ''),
+                                                       "published_at")
+                        data_set.process_statistics_all_years(self.vacancy_name, self.config)
+                    elif self.config.ingestion_mode == "frame":
+                        data_set.csv_filter_to_frame(["name", "area_name", "salary_currency"])
+                        data_set.get_statistics_from_frame(self.vacancy_name)
+                    else:
+                        data_set.process_statistics_by_chunks(self.vacancy_name, self.config)
+                    if self.config.report_timings:
+                        self.print_worker_timings(data_set)
+                    if len(data_set.salary_by_year) == 0:
                         print("Нет данных")
                     else:
-                        data_set.process_statistics_all_years(self.vacancy_name)
                         Report.generate_excel(data_set.salary_by_year, data_set.selected_vacancy_salary_by_year,
                                               data_set.vacancies_count_by_year, data_set.selected_vacancy_count_by_year,
                                               data_set.salary_by_area_sliced, data_set.fraction_by_area_sliced,
@@ -767,6 +2111,7 @@ class InputConnect:
                                             data_set.salary_by_area_sliced, data_set.fraction_by_area_sliced,
                                             self.vacancy_name)
                         self.print_statistics(data_set)
+            data_set.close()
 
 class Report:
     """Класс для представления отчёта.
@@ -1071,5 +2416,52 @@ class Report:
         else:
             return '-\n'.join(str_splitted_by_hyphen)
 
+
+def parse_arguments(args: list = None):
+    """Разбирает аргументы командной строки с настройками параллельного расчета статистики, чтения файла и режима
+    повторных запросов.
+
+    Args:
+        args (list): Список аргументов, по умолчанию берется из sys.argv
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы
+
+    >>> arguments = parse_arguments(["--executor", "thread", "--workers", "2", "--chunk-size", "4096"])
+    >>> arguments.executor, arguments.workers, arguments.chunk_size, arguments.ingestion
+    ('thread', 2, 4096, 'chunks')
+    """
+    parser = argparse.ArgumentParser(description="Вывод таблицы вакансий или статистики по профессии")
+    parser.add_argument("--executor", choices=PipelineConfig.executor_types, default="process",
+                        help="тип исполнителя для расчета статистики")
+    parser.add_argument("--workers", type=int, default=None, help="количество исполнителей в пуле")
+    parser.add_argument("--chunk-size", type=int, default=None, help="размер диапазона байтов для чтения по частям")
+    parser.add_argument("--scratch-dir", default="./splitted_csv/", help="папка для csv файлов, разделенных по годам")
+    parser.add_argument("--ingestion", choices=PipelineConfig.ingestion_modes, default="chunks",
+                        help="способ чтения файла для статистики")
+    parser.add_argument("--timings", action="store_true", help="вывести время работы исполнителей")
+    parser.add_argument("--mapped", action="store_true", help="читать csv файл с отображением в память")
+    parser.add_argument("--session", action="store_true",
+                        help="загрузить вакансии один раз и выполнять повторные запросы фильтрации")
+    return parser.parse_args(args)
+
+
+def get_pipeline_config(arguments: argparse.Namespace):
+    """Создает настройки параллельного расчета статистики по аргументам командной строки.
+
+    Args:
+        arguments (argparse.Namespace): Разобранные аргументы
+
+    Returns:
+        PipelineConfig: Настройки параллельного расчета статистики
+
+    >>> get_pipeline_config(parse_arguments(["--executor", "serial", "--ingestion", "frame"])).executor_type
+    'serial'
+    """
+    return PipelineConfig(arguments.executor, arguments.workers, arguments.chunk_size, arguments.scratch_dir,
+                          arguments.ingestion, arguments.timings)
+
+
 if __name__ == "__main__":
-    app = InputConnect()
\ No newline at end of file
+    arguments = parse_arguments()
+    app = InputConnect(get_pipeline_config(arguments), arguments.mapped, arguments.session)
\ No newline at end of file
@@ -9,6 +9,7 @@ class CurrencyConverter:
 
     Attributes:
         currencies_per_month_year (pd.DataFrame): DataFrame, содержащий курсы валют по месяцам и годам
+        rates_per_month_year (pd.DataFrame): DataFrame, содержащий курс для каждой пары месяца и валюты
     """
 
     def __init__(self, path_to_exchange_rate_csv: str):
@@ -20,6 +21,20 @@ class CurrencyConverter:
         self.currencies_per_month_year = pd.read_csv(path_to_exchange_rate_csv, delimiter=',')
         self.currencies_per_month_year["date"] = pd.to_datetime(self.currencies_per_month_year["date"], format="%Y-%m")
         self.currencies_per_month_year = self.currencies_per_month_year.set_index("date")
+        self.rates_per_month_year = self.get_rates_per_month_year()
+
+    def get_rates_per_month_year(self):
+        """Преобразует таблицу курсов валют в длинный формат, в котором каждая строка содержит месяц в виде YYYY-MM,
+        идентификатор валюты и курс. Пары без известного курса не включаются.
+
+        Returns:
+            pd.DataFrame: DataFrame со столбцами month_year, salary_currency и rate
+        """
+        rates = self.currencies_per_month_year.reset_index().melt(id_vars="date", var_name="salary_currency",
+                                                                  value_name="rate")
+        rates["month_year"] = rates["date"].dt.strftime("%Y-%m")
+        rates = rates.dropna(subset=["rate"])
+        return rates[["month_year", "salary_currency", "rate"]]
 
     def convert_to_rubles_per_month_year(self, value: float, currency: str, year: int, month: int):
         """Конвертирует указанное количество валюты в рубли по курсу на указанный месяц и год.
@@ -51,12 +66,9 @@ class CurrencyConverter:
         """
         df = pd.read_csv(path_to_vacancies_csv, delimiter=',')
         df["salary"] = df[["salary_from", "salary_to"]].mean(axis=1)
-        df["salary"] = df.apply(lambda row: row["salary"] if row["salary_currency"] == "RUR"
-        else np.nan if pd.isna(row["salary_currency"])
-        else self.convert_to_rubles_per_month_year(row["salary"],
-                                                   row["salary_currency"],
-                                                   int(row["published_at"][:4]), int(row["published_at"][5:7])),
-                                axis=1)
+        df["month_year"] = df["published_at"].str[:7]
+        df = df.merge(self.rates_per_month_year, how="left", on=["month_year", "salary_currency"])
+        df["salary"] = np.where(df["salary_currency"] == "RUR", df["salary"], np.trunc(df["salary"] * df["rate"]))
         df.drop(["salary_from", "salary_to", "salary_currency"], axis=1, inplace=True)
         df = df[["name", "salary", "area_name", "published_at"]]
         df.to_csv(processed_csv_filename, encoding="utf-8", index=False)
@@ -1,28 +1,82 @@
 import csv
-import datetime
 import sqlite3
+import time
 
+import numpy as np
 import pandas as pd
 
+import datetime_parser
+
 
 class CurrencyConverter:
-    """Класс для представления конвертера валют.
+    """Класс для представления конвертера валют. Курсы валют загружаются из базы данных один раз в массив, поэтому
+    получение курса не требует запросов к базе данных.
 
     Attributes:
+        default_pragmas (dict): (class attribute) Параметры sqlite, устанавливаемые при загрузке вакансий в базу данных
+        batch_size (int): (class attribute) Количество вакансий, загружаемых в базу данных в одной транзакции
+        vacancies_indexes (list): (class attribute) Запросы создания индексов таблицы вакансий для расчета статистики
+        vacancies_name_fts (list): (class attribute) Запросы создания и заполнения полнотекстового индекса FTS5 по
+        названиям вакансий
         exchange_rate (sqlite3.Connection): Соединение с базой данных курсов валют
+        refresh_on_miss (bool): Флаг повторной загрузки курсов из базы данных при запросе отсутствующего месяца
         currencies (set): Валюты, присутствующие в базе данных
+        currency_indexes (dict): Словарь номеров столбцов массива курсов для валют
+        month_indexes (dict): Словарь номеров строк массива курсов для пар года и месяца
+        rates (np.ndarray): Массив курсов валют к рублю размером (месяцы × валюты), неизвестные курсы равны NaN
     """
 
-    def __init__(self, path_to_exchange_rate_db: str):
-        """Инициализирует объект CurrencyConverter.
+    default_pragmas = {"journal_mode": "WAL", "synchronous": "OFF", "cache_size": -65536}
+    batch_size = 10000
+    vacancies_indexes = ["CREATE INDEX IF NOT EXISTS vacancies_year_salary ON vacancies (year, salary)",
+                         "CREATE INDEX IF NOT EXISTS vacancies_area_name_salary ON vacancies (area_name, salary)",
+                         "CREATE INDEX IF NOT EXISTS vacancies_name ON vacancies (name)"]
+    vacancies_name_fts = ["CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_name_fts USING fts5(name, content='vacancies', "
+                          "content_rowid='rowid', tokenize='trigram')",
+                          "INSERT INTO vacancies_name_fts(vacancies_name_fts) VALUES('rebuild')"]
+
+    def __init__(self, path_to_exchange_rate_db: str, refresh_on_miss: bool = False):
+        """Инициализирует объект CurrencyConverter и загружает курсы валют.
 
         Args:
             path_to_exchange_rate_db (str): Путь до sqlite файла с курсами валют по месяцам и годам
+            refresh_on_miss (bool): Флаг повторной загрузки курсов из базы данных при запросе отсутствующего месяца
         """
         self.exchange_rate = sqlite3.connect(path_to_exchange_rate_db)
+        self.refresh_on_miss = refresh_on_miss
+        self.load_rates()
+
+    def load_rates(self):
+        """Загружает все курсы валют из базы данных в массив и строит словари номеров строк и столбцов."""
         cur = self.exchange_rate.cursor()
-        self.currencies = set(filter(lambda col: col != "date", map(lambda t: t[0], list(cur.execute("SELECT * FROM EXCHANGE_RATE").description))))
+        cur.execute("SELECT * FROM EXCHANGE_RATE")
+        columns = [t[0] for t in cur.description]
+        rows = cur.fetchall()
         cur.close()
+        date_index = columns.index("date")
+        currencies = [column for column in columns if column != "date"]
+        self.currencies = set(currencies)
+        self.currency_indexes = {currency: i for i, currency in enumerate(currencies)}
+        self.month_indexes = {(int(row[date_index][:4]), int(row[date_index][5:7])): i for i, row in enumerate(rows)}
+        self.rates = np.array([[value for i, value in enumerate(row) if i != date_index] for row in rows],
+                              dtype=np.float64).reshape(len(rows), len(currencies))
+
+    def get_month_index(self, year: int, month: int):
+        """Возвращает номер строки массива курсов для указанного месяца и года. Если месяц отсутствует и разрешена
+        повторная загрузка, курсы загружаются из базы данных заново.
+
+        Args:
+            year (int): Год
+            month (int): Месяц
+
+        Returns:
+            int: Номер строки массива курсов или None, если месяц отсутствует
+        """
+        month_index = self.month_indexes.get((year, month))
+        if month_index is None and self.refresh_on_miss:
+            self.load_rates()
+            month_index = self.month_indexes.get((year, month))
+        return month_index
 
     def get_rate_at_month_year(self, currency: str, year: int, month: int):
         """Возвращает отношение указанной валюты к рублям в указанный месяц и год.
@@ -33,17 +87,40 @@ class CurrencyConverter:
             month (int): Месяц
 
         Returns:
-            float: Отношение указанной валюты к рублям в указанный месяц и год
+            float: Отношение указанной валюты к рублям в указанный месяц и год или None, если курс неизвестен
         """
-        if currency not in self.currencies:
+        currency_index = self.currency_indexes.get(currency)
+        if currency_index is None:
             return None
-        cur = self.exchange_rate.cursor()
-        date_str = f"{year}-{str(month).zfill(2)}"
-        sql = f"SELECT {currency} FROM EXCHANGE_RATE WHERE date = '{date_str}'"
-        cur.execute(sql)
-        rate = cur.fetchone()
-        cur.close()
-        return rate[0]
+        month_index = self.get_month_index(year, month)
+        if month_index is None:
+            return None
+        rate = self.rates[month_index, currency_index]
+        if np.isnan(rate):
+            return None
+        return float(rate)
+
+    def get_rates_at_month_year(self, currencies: list, years: list, months: list):
+        """Возвращает отношения валют к рублям для набора вакансий одной операцией индексации массива курсов.
+
+        Args:
+            currencies (list): Идентификаторы валют
+            years (list): Годы
+            months (list): Месяцы
+
+        Returns:
+            np.ndarray: Массив курсов, неизвестные курсы равны NaN
+        """
+        month_indexes = [self.get_month_index(year, month) for year, month in zip(years, months)]
+        currency_indexes = [self.currency_indexes.get(currency) for currency in currencies]
+        is_known = np.array([month_index is not None and currency_index is not None
+                             for month_index, currency_index in zip(month_indexes, currency_indexes)], dtype=bool)
+        rates = np.full(len(is_known), np.nan)
+        if is_known.any():
+            rows = np.array([i for i, known in zip(month_indexes, is_known) if known], dtype=np.intp)
+            columns = np.array([i for i, known in zip(currency_indexes, is_known) if known], dtype=np.intp)
+            rates[is_known] = self.rates[rows, columns]
+        return rates
 
     def convert_to_rubles_per_month_year(self, value: float, currency: str, year: int, month: int):
         """Конвертирует указанное количество валюты в рубли по курсу на указанный месяц и год.
@@ -64,46 +141,124 @@ class CurrencyConverter:
             return None
         return int(value * rate)
 
-    def process_vacancies(self, path_to_vacancies_csv: str, processed_db_filename: str):
+    def convert_vacancies_batch(self, lines: list):
+        """Преобразует строки csv файла с вакансиями в строки таблицы вакансий, переводя зарплаты в рубли при
+        необходимости. Курсы валют для всех строк получаются одной операцией.
+
+        Args:
+            lines (list): Строки csv файла
+
+        Returns:
+            list: Список кортежей названия, зарплаты, региона, времени публикации, года и месяца вакансии
+        """
+        values, currencies, published_at_list = [], [], []
+        for line in lines:
+            salary_from, salary_to, salary_currency = line[1], line[2], line[3]
+            if salary_from == salary_to == "" or salary_currency == "":
+                value = None
+            elif salary_from != "" and salary_to == "":
+                value = float(salary_from)
+            elif salary_from == "" and salary_to != "":
+                value = float(salary_to)
+            else:
+                value = (float(salary_from) + float(salary_to)) / 2
+            values.append(value)
+            currencies.append(salary_currency)
+            published_at_list.append(datetime_parser.convert_str_to_datetime(line[5]))
+        rates = self.get_rates_at_month_year(currencies,
+                                             [published_at.year for published_at in published_at_list],
+                                             [published_at.month for published_at in published_at_list])
+        rows = []
+        for line, value, currency, rate, published_at in zip(lines, values, currencies, rates.tolist(),
+                                                            published_at_list):
+            if currency == "RUR":
+                rate = 1.0
+            salary = None if value is None or rate != rate else int(value * rate)
+            rows.append((line[0], salary, line[4], published_at.strftime("%Y-%m-%dT%H:%M:%S%z"), published_at.year,
+                         published_at.month))
+        return rows
+
+    def get_vacancies_batches(self, csv_reader, batch_size: int):
+        """Читает строки csv файла с вакансиями частями указанного размера и преобразует их в строки таблицы вакансий.
+
+        Args:
+            csv_reader: Csv reader файла с вакансиями
+            batch_size (int): Количество строк в части
+
+        Returns:
+            Генератор списков строк таблицы вакансий
+        """
+        lines = []
+        for line in csv_reader:
+            lines.append(line)
+            if len(lines) == batch_size:
+                yield self.convert_vacancies_batch(lines)
+                lines = []
+        if lines:
+            yield self.convert_vacancies_batch(lines)
+
+    @staticmethod
+    def apply_pragmas(conn: sqlite3.Connection, pragmas: dict):
+        """Устанавливает параметры sqlite для соединения.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой данных
+            pragmas (dict): Словарь значений параметров sqlite
+        """
+        for pragma, value in pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+    def process_vacancies(self, path_to_vacancies_csv: str, processed_db_filename: str, batch_size: int = None,
+                          pragmas: dict = None):
         """Обрабатывает csv файл с вакансиями, переводя зарплаты в рубли при необходимости, и сохраняет результат в
-        новый sqlite файл.
+        новый sqlite файл. Файл читается частями, каждая часть записывается в отдельной транзакции, поэтому в памяти
+        хранится не больше одной части. После загрузки создаются индексы для расчета статистики. Выводит скорость
+        загрузки в строках в секунду. Если sqlite поддерживает FTS5, по названиям вакансий строится полнотекстовый
+        индекс.
 
         Args:
             path_to_vacancies_csv (str): Путь до csv файла с вакансиями
             processed_db_filename (str): Имя файла результата
+            batch_size (int): Количество вакансий в одной транзакции
+            pragmas (dict): Параметры sqlite, заменяющие параметры по умолчанию
+
+        Returns:
+            int: Количество загруженных вакансий
         """
-        vacancies = open(path_to_vacancies_csv, 'r', encoding="utf-8-sig")
-        csv_reader = csv.reader(vacancies)
-        next(csv_reader)
-        data = []
-        for line in csv_reader:
-            name = line[0]
-            salary_from = line[1]
-            salary_to = line[2]
-            salary_currency = line[3]
-            area_name = line[4]
-            published_at = datetime.datetime.strptime(line[5], "%Y-%m-%dT%H:%M:%S%z")
-            if salary_from == salary_to == "" or salary_currency == "":
-                salary = None
-            elif (salary_from != "" and salary_to == "") or (salary_from == "" and salary_to != ""):
-                if salary_from != "":
-                    salary = self.convert_to_rubles_per_month_year(float(salary_from), salary_currency,
-                                                                   published_at.year, published_at.month)
-                else:
-                    salary = self.convert_to_rubles_per_month_year(float(salary_to), salary_currency,
-                                                                   published_at.year, published_at.month)
-            else:
-                mean_salary = (float(salary_from) + float(salary_to)) / 2
-                salary = self.convert_to_rubles_per_month_year(mean_salary, salary_currency,
-                                                        published_at.year, published_at.month)
-            data.append([name, salary, area_name, published_at.strftime("%Y-%m-%dT%H:%M:%S%z")])
-        conn = sqlite3.connect(processed_db_filename)
+        batch_size = batch_size or CurrencyConverter.batch_size
+        conn = sqlite3.connect(processed_db_filename, isolation_level=None)
+        CurrencyConverter.apply_pragmas(conn, {**CurrencyConverter.default_pragmas, **(pragmas or {})})
         cur = conn.cursor()
+        cur.execute("DROP TABLE IF EXISTS vacancies_name_fts")
         cur.execute("DROP TABLE IF EXISTS vacancies")
-        cur.execute("CREATE TABLE vacancies (name, salary, area_name, published_at)")
-        cur.executemany("INSERT INTO vacancies VALUES(?, ?, ?, ?)", data)
-        conn.commit()
+        cur.execute("CREATE TABLE vacancies (name TEXT, salary REAL, area_name TEXT, published_at TEXT, "
+                    "year INTEGER, month INTEGER)")
+        rows_count = 0
+        start = time.perf_counter()
+        with open(path_to_vacancies_csv, 'r', encoding="utf-8-sig", newline='') as vacancies:
+            csv_reader = csv.reader(vacancies)
+            next(csv_reader)
+            for batch in self.get_vacancies_batches(csv_reader, batch_size):
+                cur.execute("BEGIN")
+                cur.executemany("INSERT INTO vacancies VALUES(?, ?, ?, ?, ?, ?)", batch)
+                cur.execute("COMMIT")
+                rows_count += len(batch)
+        cur.execute("BEGIN")
+        for index_sql in CurrencyConverter.vacancies_indexes:
+            cur.execute(index_sql)
+        cur.execute("COMMIT")
+        try:
+            cur.execute("BEGIN")
+            for fts_sql in CurrencyConverter.vacancies_name_fts:
+                cur.execute(fts_sql)
+            cur.execute("COMMIT")
+        except sqlite3.OperationalError:
+            cur.execute("ROLLBACK")
+        elapsed = time.perf_counter() - start
+        cur.close()
         conn.close()
+        print(f"Загружено {rows_count} вакансий за {elapsed:.2f} с ({rows_count / elapsed:.0f} строк/с)")
+        return rows_count
 
 
 currency_converter = CurrencyConverter("exchange_rate.sqlite")
@@ -2,13 +2,17 @@ import cProfile
 import csv
 import re
 import datetime
+import logging
 import sqlite3
-
-import dateutil.tz
+import time
 
 import pandas as pd
 from prettytable import prettytable
 
+import datetime_parser
+
+logger = logging.getLogger(__name__)
+
 
 def profile(func):
     def wrapper(*args, **kwargs):
@@ -87,18 +91,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
@@ -179,8 +172,14 @@ class DataSet:
         salary_by_area_df (pd.DataFrame): DataFrame средней зарплаты по городам
         vacancies_count_by_area_df (pd.DataFrame): DataFrame количества вакансий по городам
         fraction_by_area_df (pd.DataFrame): DataFrame доли вакансий от общего числа вакансий по городам
+        fts_min_length (int): (class attribute) Минимальная длина названия профессии для поиска по полнотекстовому
+        индексу
+        like_wildcards (str): (class attribute) Символы шаблонов LIKE
     """
 
+    fts_min_length = 3
+    like_wildcards = "%_"
+
     def __init__(self, file_name: str):
         """Инициализирует объект DataSet.
 
@@ -382,52 +381,134 @@ class DataSet:
             return InputConnect.currency_naming[vacancy.salary.salary_currency] == filter_value
         return False
 
+    @staticmethod
+    def get_year_column(conn: sqlite3.Connection):
+        """Возвращает выражение SQL года публикации вакансии. Базы данных, загруженные до появления столбца года,
+        не изменяются: год в них вычисляется из даты публикации, а индексы для расчета статистики создаются только при
+        загрузке вакансий.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой данных вакансий
+
+        Returns:
+            str: Выражение SQL года публикации
+
+        >>> conn = sqlite3.connect(":memory:")
+        >>> _ = conn.execute("CREATE TABLE vacancies (name TEXT, salary REAL, area_name TEXT, published_at TEXT)")
+        >>> DataSet.get_year_column(conn)
+        'substr(published_at, 1, 4)'
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(vacancies)")]
+        return "vacancies.year" if "year" in columns else "substr(published_at, 1, 4)"
+
+    @staticmethod
+    def has_name_fts(conn: sqlite3.Connection):
+        """Проверяет наличие полнотекстового индекса FTS5 по названиям вакансий, который строится при загрузке вакансий
+        в базу данных.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой данных вакансий
+
+        Returns:
+            bool: True, если индекс есть, иначе False
+        """
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'vacancies_name_fts'").fetchone() is not None
+
+    @staticmethod
+    def get_selected_vacancy_condition(selected_vacancy: str, has_name_fts: bool):
+        """Возвращает условие SQL для вакансий выбранной профессии и его параметры. Если доступен полнотекстовый индекс
+        и название профессии не короче триграммы, кандидаты выбираются по индексу, а затем проверяются через LIKE, иначе
+        проверяются все названия. Символы % и _ в названии профессии являются шаблонами LIKE, а индекс ищет их
+        буквально, поэтому такие названия проверяются только через LIKE.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+            has_name_fts (bool): Флаг наличия полнотекстового индекса по названиям вакансий
+
+        Returns:
+            tuple: Условие SQL и кортеж его параметров
+
+        >>> DataSet.get_selected_vacancy_condition("ИТ", True)
+        ("name LIKE '%' || ? || '%'", ('ИТ',))
+        >>> DataSet.get_selected_vacancy_condition("Python", True)[1]
+        ('"Python"', 'Python')
+        >>> DataSet.get_selected_vacancy_condition("Про%ст", True)[1]
+        ('Про%ст',)
+        """
+        like_condition = "name LIKE '%' || ? || '%'"
+        if not has_name_fts or len(selected_vacancy) < DataSet.fts_min_length or \
+                any(wildcard in selected_vacancy for wildcard in DataSet.like_wildcards):
+            return like_condition, (selected_vacancy,)
+        fts_phrase = '"' + selected_vacancy.replace('"', '""') + '"'
+        return f"rowid IN (SELECT rowid FROM vacancies_name_fts WHERE vacancies_name_fts MATCH ?) AND {like_condition}", \
+            (fts_phrase, selected_vacancy)
+
+    @staticmethod
+    def read_statistics_query(conn: sqlite3.Connection, sql: str, params: tuple = ()):
+        """Выполняет запрос статистики и записывает в лог его план выполнения и время работы.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой данных вакансий
+            sql (str): Текст запроса
+            params (tuple): Параметры запроса
+
+        Returns:
+            pd.DataFrame: Результат запроса
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+                logger.debug("План запроса: %s", row[-1])
+        start = time.perf_counter()
+        result = pd.read_sql_query(sql, conn, params=params)
+        logger.info("Запрос выполнен за %.3f с, строк: %d", time.perf_counter() - start, len(result))
+        return result
+
     def get_statistics_using_sql(self, path_to_db_file: str, selected_vacancy: str):
-        """Производит расчет статистики по требуемой профессии, используя SQL.
+        """Производит расчет статистики по требуемой профессии, используя SQL. Общая статистика по годам вычисляется
+        запросом, который читает только индекс (year, salary), статистика выбранной профессии по годам - отдельным
+        запросом по вакансиям, найденным по полнотекстовому индексу названий, а статистика по городам - одним запросом
+        с общим количеством вакансий, полученным оконной функцией. Год выводится строкой, как в исходных запросах.
 
         Args:
             path_to_db_file (str): Путь до sqlite файла с вакансиями
             selected_vacancy (str): Профессия, по которой требуется получить статистику
         """
         conn = sqlite3.connect(path_to_db_file)
-        salary_by_year_query = pd.read_sql_query("""
-        SELECT substr(published_at, 1, 4) AS year,
-		round(avg(salary)) AS salary FROM vacancies GROUP BY year;
-        """, conn)
-        self.salary_by_year_df = pd.DataFrame(salary_by_year_query)
-        vacancies_count_by_year_query = pd.read_sql_query("""
-        SELECT substr(published_at, 1, 4) AS year,
-		count(name) as vacancies_count FROM vacancies GROUP BY year;
-        """, conn)
-        self.vacancies_count_by_year_df = pd.DataFrame(vacancies_count_by_year_query)
-        selected_vacancy_salary_by_year_query = pd.read_sql_query(f"""
-        SELECT substr(published_at, 1, 4) AS year,
- 		round(avg(salary)) AS selected_vacancy_salary FROM vacancies WHERE name like '%{selected_vacancy}%' GROUP BY year;
-        """, conn)
-        self.selected_vacancy_salary_by_year_df = pd.DataFrame(selected_vacancy_salary_by_year_query)
-        selected_vacancy_count_by_year_query = pd.read_sql_query(f"""
-        SELECT substr(published_at, 1, 4) AS year,
-        count(name) as selected_vacancy_count FROM vacancies WHERE name like '%{selected_vacancy}%' GROUP BY year;
-        """, conn)
-        self.selected_vacancy_count_by_year_df = pd.DataFrame(selected_vacancy_count_by_year_query)
-        salary_by_area_query = pd.read_sql_query("""
-        SELECT area_name, round(avg(salary)) AS salary 
-        FROM vacancies 
-        GROUP BY area_name 
-        HAVING CAST(count(area_name) as REAL) / (SELECT count(area_name) FROM vacancies) >= 0.01
-        ORDER BY salary DESC
-        LIMIT 10;
-        """, conn)
-        self.salary_by_area_df = pd.DataFrame(salary_by_area_query)
-        fraction_by_area_query = pd.read_sql_query("""
-        SELECT area_name, CAST(count(area_name) as REAL) / (SELECT count(area_name) FROM vacancies) AS fraction
-        FROM vacancies 
-        GROUP BY area_name 
-        HAVING fraction >= 0.01
-        ORDER BY fraction DESC
-        LIMIT 10;
-        """, conn)
-        self.fraction_by_area_df = pd.DataFrame(fraction_by_area_query)
+        year_column = DataSet.get_year_column(conn)
+        selected_condition, selected_params = DataSet.get_selected_vacancy_condition(selected_vacancy,
+                                                                                     DataSet.has_name_fts(conn))
+        by_year_df = DataSet.read_statistics_query(conn, f"""
+        SELECT CAST({year_column} AS TEXT) AS year,
+        round(avg(salary)) AS salary,
+        count(*) AS vacancies_count
+        FROM vacancies
+        GROUP BY {year_column};
+        """)
+        self.salary_by_year_df = by_year_df[["year", "salary"]]
+        self.vacancies_count_by_year_df = by_year_df[["year", "vacancies_count"]]
+        selected_by_year_df = DataSet.read_statistics_query(conn, f"""
+        SELECT CAST({year_column} AS TEXT) AS year,
+        round(avg(salary)) AS selected_vacancy_salary,
+        count(*) AS selected_vacancy_count
+        FROM vacancies
+        WHERE {selected_condition}
+        GROUP BY {year_column};
+        """, selected_params)
+        self.selected_vacancy_salary_by_year_df = selected_by_year_df[["year", "selected_vacancy_salary"]]
+        self.selected_vacancy_count_by_year_df = selected_by_year_df[["year", "selected_vacancy_count"]]
+        by_area_df = DataSet.read_statistics_query(conn, """
+        SELECT area_name,
+        round(avg(salary)) AS salary,
+        CAST(count(*) AS REAL) / sum(count(*)) OVER () AS fraction
+        FROM vacancies
+        GROUP BY area_name;
+        """)
+        conn.close()
+        by_area_df = by_area_df[by_area_df["fraction"] >= 0.01]
+        self.salary_by_area_df = by_area_df.sort_values("salary", ascending=False, kind="stable") \
+                                     .head(10)[["area_name", "salary"]].reset_index(drop=True)
+        self.fraction_by_area_df = by_area_df.sort_values("fraction", ascending=False, kind="stable") \
+                                       .head(10)[["area_name", "fraction"]].reset_index(drop=True)
 
 
 class InputConnect:
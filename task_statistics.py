@@ -1,8 +1,11 @@
+import argparse
+import collections
 import csv
 import re
 import itertools
 import datetime
-import dateutil.tz
+import hashlib
+import json
 import os
 
 from openpyxl import Workbook
@@ -15,6 +18,9 @@ import pdfkit
 import matplotlib.pyplot as plt
 import numpy as np
 
+import dataset_cache
+import datetime_parser
+
 
 class Vacancy:
     """Класс для представления вакансии.
@@ -46,18 +52,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
@@ -111,14 +106,339 @@ class Salary:
         return salary_average * Salary.currency_to_rub[self.salary_currency]
 
 
+class AhoCorasick:
+    """Класс для представления автомата Ахо-Корасик, находящего все вхождения набора подстрок в строку за один проход
+    по ней.
+
+    Attributes:
+        patterns (list): Искомые подстроки
+        transitions (list): Словари переходов для каждого состояния автомата
+        fail (list): Состояния, в которые автомат переходит при отсутствии перехода по символу
+        outputs (list): Множества номеров подстрок, найденных при достижении каждого состояния
+    """
+
+    def __init__(self, patterns):
+        """Инициализирует объект AhoCorasick и строит автомат по подстрокам. Пустые подстроки не ищутся.
+
+        Args:
+            patterns: Итерируемый объект искомых подстрок
+        """
+        self.patterns = list(patterns)
+        self.transitions = [{}]
+        self.fail = [0]
+        self.outputs = [set()]
+        for i, pattern in enumerate(self.patterns):
+            if pattern == '':
+                continue
+            state = 0
+            for char in pattern:
+                if char not in self.transitions[state]:
+                    self.transitions[state][char] = len(self.transitions)
+                    self.transitions.append({})
+                    self.fail.append(0)
+                    self.outputs.append(set())
+                state = self.transitions[state][char]
+            self.outputs[state].add(i)
+        queue = collections.deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fail_state = self.fail[state]
+                while fail_state and char not in self.transitions[fail_state]:
+                    fail_state = self.fail[fail_state]
+                if state != 0 and char in self.transitions[fail_state]:
+                    fail_state = self.transitions[fail_state][char]
+                self.fail[next_state] = fail_state
+                self.outputs[next_state] |= self.outputs[fail_state]
+
+    def find(self, text: str):
+        """Возвращает номера подстрок, входящих в строку.
+
+        Args:
+            text (str): Строка для поиска
+
+        Returns:
+            set: Множество номеров найденных подстрок
+
+        >>> sorted(AhoCorasick(["he", "she", "his", "hers"]).find("ushers"))
+        [0, 1, 3]
+        >>> sorted(AhoCorasick(["Python", "Java", "аналитик", ""]).find("Системный аналитик (Python)"))
+        [0, 2]
+        """
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(char, 0)
+            if self.outputs[state]:
+                found |= self.outputs[state]
+        return found
+
+
+class NameIndex:
+    """Класс для представления индекса n-грамм по названиям вакансий. Для каждой n-граммы хранится множество номеров
+    названий, в которых она встречается, поэтому поиск подстроки сводится к пересечению нескольких множеств и проверке
+    только найденных названий.
+
+    Attributes:
+        ngram_length (int): (class attribute) Длина n-граммы
+        names (list): Названия вакансий
+        postings (dict): Словарь множеств номеров названий для каждой n-граммы
+    """
+
+    ngram_length = 3
+
+    def __init__(self, names):
+        """Инициализирует объект NameIndex и строит индекс по названиям вакансий.
+
+        Args:
+            names: Итерируемый объект названий вакансий
+        """
+        self.names = list(names)
+        self.postings = {}
+        for i, name in enumerate(self.names):
+            for ngram in NameIndex.get_ngrams(name):
+                self.postings.setdefault(ngram, set()).add(i)
+
+    @staticmethod
+    def get_ngrams(s: str):
+        """Возвращает множество n-грамм строки.
+
+        Args:
+            s (str): Строка
+
+        Returns:
+            set: Множество n-грамм
+
+        >>> sorted(NameIndex.get_ngrams("Python"))
+        ['Pyt', 'hon', 'tho', 'yth']
+        """
+        return {s[i:i + NameIndex.ngram_length] for i in range(len(s) - NameIndex.ngram_length + 1)}
+
+    def find(self, substring: str):
+        """Возвращает названия вакансий, содержащие подстроку. Подстроки короче n-граммы ищутся перебором всех названий.
+
+        Args:
+            substring (str): Подстрока
+
+        Returns:
+            list: Названия вакансий, содержащие подстроку
+
+        >>> NameIndex(["Программист Python", "Python-разработчик", "Аналитик"]).find("Python")
+        ['Программист Python', 'Python-разработчик']
+        >>> NameIndex(["Программист Python", "Аналитик"]).find("ик")
+        ['Аналитик']
+        >>> NameIndex(["Программист Python", "Аналитик"]).find("Java")
+        []
+        """
+        if len(substring) < NameIndex.ngram_length:
+            return [name for name in self.names if substring in name]
+        postings = []
+        for ngram in NameIndex.get_ngrams(substring):
+            if ngram not in self.postings:
+                return []
+            postings.append(self.postings[ngram])
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [self.names[i] for i in sorted(candidates) if substring in self.names[i]]
+
+
+class StatisticsSnapshot:
+    """Класс для представления сохраняемого снимка накопленной статистики. Хранит суммы зарплат и количества вакансий
+    по годам, городам и названиям вакансий, а также время публикации самой поздней учтенной вакансии (водяной знак),
+    поэтому при обработке нового файла достаточно добавить только более поздние вакансии. Для вакансий, опубликованных
+    ровно во время водяного знака, хранятся хэши учтенных строк, поэтому такие вакансии из следующих файлов учитываются,
+    а уже учтенные - нет. Вакансии, опубликованные раньше водяного знака, считаются опоздавшими и не добавляются в
+    снимок: чтобы учесть их, снимок нужно построить заново.
+
+    Attributes:
+        salary_by_year (dict): Словарь суммы зарплат по годам
+        vacancies_count_by_year (dict): Словарь количества вакансий по годам
+        salary_by_area (dict): Словарь суммы зарплат по городам
+        vacancies_count_by_area (dict): Словарь количества вакансий по городам
+        salary_by_name_and_year (dict): Словарь сумм зарплат по годам для каждого названия вакансии
+        vacancies_count_by_name_and_year (dict): Словарь количества вакансий по годам для каждого названия вакансии
+        watermark (str): Время публикации самой поздней учтенной вакансии
+        watermark_datetime (datetime): Время публикации самой поздней учтенной вакансии в виде datetime
+        watermark_row_hashes (list): Хэши учтенных строк csv файлов, опубликованных во время водяного знака, или None для
+        снимков, сохраненных без хэшей: тогда все вакансии, опубликованные во время водяного знака, считаются учтенными
+        name_index (NameIndex): Индекс n-грамм по названиям вакансий снимка, строится при первом поиске профессии
+    """
+
+    def __init__(self):
+        """Инициализирует пустой объект StatisticsSnapshot."""
+        self.salary_by_year = {}
+        self.vacancies_count_by_year = {}
+        self.salary_by_area = {}
+        self.vacancies_count_by_area = {}
+        self.salary_by_name_and_year = {}
+        self.vacancies_count_by_name_and_year = {}
+        self.watermark = None
+        self.watermark_datetime = None
+        self.watermark_row_hashes = []
+        self.name_index = None
+
+    @staticmethod
+    def load(file_name: str):
+        """Загружает снимок статистики из json файла. Если файла нет, возвращает пустой снимок.
+
+        Args:
+            file_name (str): Имя json файла снимка
+
+        Returns:
+            StatisticsSnapshot: Снимок статистики
+        """
+        snapshot = StatisticsSnapshot()
+        if not os.path.exists(file_name):
+            return snapshot
+        with open(file_name, 'r', encoding="utf-8") as file:
+            data = json.load(file)
+        snapshot.salary_by_year = {int(year): value for year, value in data["salary_by_year"].items()}
+        snapshot.vacancies_count_by_year = {int(year): value for year, value in data["vacancies_count_by_year"].items()}
+        snapshot.salary_by_area = data["salary_by_area"]
+        snapshot.vacancies_count_by_area = data["vacancies_count_by_area"]
+        snapshot.salary_by_name_and_year = {name: {int(year): value for year, value in by_year.items()}
+                                            for name, by_year in data["salary_by_name_and_year"].items()}
+        snapshot.vacancies_count_by_name_and_year = {name: {int(year): value for year, value in by_year.items()}
+                                                     for name, by_year in
+                                                     data["vacancies_count_by_name_and_year"].items()}
+        snapshot.set_watermark(data["watermark"], data.get("watermark_row_hashes"))
+        return snapshot
+
+    def save(self, file_name: str):
+        """Сохраняет снимок статистики в json файл. Файл сначала записывается во временный файл и затем заменяет
+        исходный, поэтому прерванная запись не портит предыдущий снимок.
+
+        Args:
+            file_name (str): Имя json файла снимка
+        """
+        data = {"watermark": self.watermark,
+                "watermark_row_hashes": self.watermark_row_hashes,
+                "salary_by_year": self.salary_by_year,
+                "vacancies_count_by_year": self.vacancies_count_by_year,
+                "salary_by_area": self.salary_by_area,
+                "vacancies_count_by_area": self.vacancies_count_by_area,
+                "salary_by_name_and_year": self.salary_by_name_and_year,
+                "vacancies_count_by_name_and_year": self.vacancies_count_by_name_and_year}
+        temp_file_name = f"{file_name}.tmp"
+        with open(temp_file_name, 'w', encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp_file_name, file_name)
+
+    def set_watermark(self, published_at: str, row_hashes: list = None):
+        """Устанавливает время публикации самой поздней учтенной вакансии и хэши учтенных строк, опубликованных в это
+        время.
+
+        Args:
+            published_at (str): Время публикации вакансии или None
+            row_hashes (list): Хэши учтенных строк, опубликованных в это время, или None, если они неизвестны
+        """
+        self.watermark = published_at
+        self.watermark_row_hashes = row_hashes
+        self.watermark_datetime = datetime_parser.convert_str_to_datetime(published_at) if published_at else None
+
+    def is_new(self, published_at: datetime.datetime):
+        """Проверяет, опубликована ли вакансия позже самой поздней учтенной вакансии.
+
+        Args:
+            published_at (datetime): Время публикации вакансии
+
+        Returns:
+            bool: True, если вакансия еще не учтена в снимке, иначе False
+
+        >>> snapshot = StatisticsSnapshot()
+        >>> snapshot.set_watermark("2022-12-05T12:00:00+0300")
+        >>> snapshot.is_new(datetime_parser.convert_str_to_datetime("2022-12-05T10:00:00+0000"))
+        True
+        >>> snapshot.is_new(datetime_parser.convert_str_to_datetime("2022-12-05T12:00:00+0300"))
+        False
+        """
+        return self.watermark_datetime is None or published_at > self.watermark_datetime
+
+    def is_at_watermark(self, published_at: datetime.datetime):
+        """Проверяет, опубликована ли вакансия ровно во время самой поздней учтенной вакансии.
+
+        Args:
+            published_at (datetime): Время публикации вакансии
+
+        Returns:
+            bool: True, если время публикации совпадает с водяным знаком, иначе False
+
+        >>> snapshot = StatisticsSnapshot()
+        >>> snapshot.set_watermark("2022-12-05T12:00:00+0300")
+        >>> snapshot.is_at_watermark(datetime_parser.convert_str_to_datetime("2022-12-05T09:00:00+0000"))
+        True
+        """
+        return self.watermark_datetime is not None and published_at == self.watermark_datetime
+
+    @staticmethod
+    def get_row_hash(line: list):
+        """Возвращает хэш строки csv файла, по которому распознаются уже учтенные вакансии.
+
+        Args:
+            line (list): Строка csv файла
+
+        Returns:
+            str: Шестнадцатеричная запись хэша
+        """
+        return hashlib.blake2b('\x1f'.join(line).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_name_index(self):
+        """Возвращает индекс n-грамм по названиям вакансий снимка, строя его заново, если в снимке появились новые
+        названия.
+
+        Returns:
+            NameIndex: Индекс по названиям вакансий
+        """
+        if self.name_index is None:
+            self.name_index = NameIndex(self.vacancies_count_by_name_and_year)
+        return self.name_index
+
+    def add(self, name: str, salary: float, area: str, year: int):
+        """Добавляет зарплату вакансии к суммам и счетчикам снимка.
+
+        Args:
+            name (str): Название вакансии
+            salary (float): Средняя зарплата вакансии в рублях
+            area (str): Регион вакансии
+            year (int): Год публикации вакансии
+
+        >>> snapshot = StatisticsSnapshot()
+        >>> snapshot.add("Программист", 20000.0, "Москва", 2022)
+        >>> snapshot.add("Программист", 30000.0, "Москва", 2022)
+        >>> snapshot.salary_by_name_and_year, snapshot.vacancies_count_by_area
+        ({'Программист': {2022: 50000.0}}, {'Москва': 2})
+        """
+        self.salary_by_year[year] = self.salary_by_year.get(year, 0) + salary
+        self.vacancies_count_by_year[year] = self.vacancies_count_by_year.get(year, 0) + 1
+        self.salary_by_area[area] = self.salary_by_area.get(area, 0) + salary
+        self.vacancies_count_by_area[area] = self.vacancies_count_by_area.get(area, 0) + 1
+        if name not in self.salary_by_name_and_year:
+            self.name_index = None
+        salary_by_year = self.salary_by_name_and_year.setdefault(name, {})
+        salary_by_year[year] = salary_by_year.get(year, 0) + salary
+        vacancies_count_by_year = self.vacancies_count_by_name_and_year.setdefault(name, {})
+        vacancies_count_by_year[year] = vacancies_count_by_year.get(year, 0) + 1
+
+
 class DataSet:
     """Класс для представления данных вакансий.
 
     Attributes:
+        html_tag_pattern (Pattern): (class attribute) Регулярное выражение html тега
+        dirty_str_pattern (Pattern): (class attribute) Регулярное выражение для поиска html тегов, переносов строк и
+        лишних пробелов
         __file_name (str): Имя файла для обработки данных
         __list_naming (list): Названия столбцов таблицы
         reader (_reader): Объект чтения для чтения строк из файла
         vacancies (list): Список вакансий
+        vacancies_count (int): Количество вакансий, учтенных в статистике
+        late_vacancies_count (int): Количество вакансий, опубликованных раньше водяного знака снимка статистики и
+        поэтому не добавленных в него
+        statistics_by_profession (dict): Словарь пар словарей средней зарплаты и количества вакансий по годам для каждой
+        профессии при расчете статистики по нескольким профессиям
         salary_by_year (dict): Словарь средней зарплаты по годам
         vacancies_count_by_year (dict): Словарь количества вакансий по годам
         selected_vacancy_salary_by_year (dict): Словарь средней зарплаты выбранной профессии по годам
@@ -136,6 +456,9 @@ class DataSet:
         первые 10 элементов
     """
 
+    html_tag_pattern = re.compile("<.*?>")
+    dirty_str_pattern = re.compile(r"<|\s\s|^\s|\s$|[^\S ]")
+
     def __init__(self, file_name: str):
         """Инициализирует объект DataSet.
 
@@ -155,6 +478,8 @@ class DataSet:
         Returns:
             str: Строка, состоящая из объединненых символами переноса строки строк, очищенных от html тегов и лишних пробелов
         """
+        if DataSet.dirty_str_pattern.search(value) is None:
+            return value
         temp = value.split('\n')
         result = [self.get_clear_str(s) for s in temp]
         return '\n'.join(result)
@@ -168,7 +493,9 @@ class DataSet:
         Returns:
             str: Строка, очищенная от html тегов и лишних пробелов
         """
-        str_without_tags = re.sub("<.*?>", '', s)
+        if DataSet.dirty_str_pattern.search(s) is None:
+            return s
+        str_without_tags = DataSet.html_tag_pattern.sub('', s)
         str_without_spaces = ' '.join(str_without_tags.split())
         return str_without_spaces
 
@@ -191,24 +518,217 @@ class DataSet:
          и сохраняет их в список вакансий."""
         self.vacancies = []
         for line in self.reader:
-            if len(line) == len(self.__list_naming) and '' not in line:
-                name = self.get_clear_value(line[0])
-                salary_from = int(float(self.get_clear_value(line[1])))
-                salary_to = int(float(self.get_clear_value(line[2])))
-                salary_currency = self.get_clear_value(line[3])
-                salary = Salary(salary_from, salary_to, salary_currency)
-                area_name = self.get_clear_value(line[4])
-                published_at = self.get_clear_value(line[5])
-                vacancy = Vacancy(name, salary, area_name, published_at)
-                salary.rub_average = salary.get_rub_average()
+            vacancy = self.parse_vacancy(line)
+            if vacancy is not None:
                 self.vacancies.append(vacancy)
 
+    def parse_vacancy(self, line: list):
+        """Создает вакансию из строки csv файла, если строка содержит все необходимые данные, очищая значения от лишних
+        пробелов и html тегов.
+
+        Args:
+            line (list): Строка csv файла
+
+        Returns:
+            Vacancy: Вакансия или None, если строка содержит не все данные
+        """
+        if len(line) != len(self.__list_naming) or '' in line:
+            return None
+        name = self.get_clear_value(line[0])
+        salary_from = int(float(self.get_clear_value(line[1])))
+        salary_to = int(float(self.get_clear_value(line[2])))
+        salary_currency = self.get_clear_value(line[3])
+        salary = Salary(salary_from, salary_to, salary_currency)
+        area_name = self.get_clear_value(line[4])
+        published_at = self.get_clear_value(line[5])
+        vacancy = Vacancy(name, salary, area_name, published_at)
+        salary.rub_average = salary.get_rub_average()
+        return vacancy
+
     def get_statistics(self, selected_vacancy: str):
         """Производит расчет статистики по требуемой профессии.
 
         Args:
             selected_vacancy (str): Профессия, по которой требуется получить статистику
         """
+        self.init_statistics()
+        for vacancy in self.vacancies:
+            self.add_to_statistics(vacancy.name, vacancy.salary.get_rub_average(), vacancy.area_name,
+                                   vacancy.published_at.year, selected_vacancy)
+        self.vacancies_count = len(self.vacancies)
+        self.complete_statistics(selected_vacancy)
+
+    def get_statistics_streaming(self, selected_vacancy: str):
+        """Производит расчет статистики по требуемой профессии за один проход по файлу, не сохраняя вакансии в памяти.
+        Результат совпадает с последовательным вызовом csv_filter и get_statistics. Объекты вакансий и datetime не
+        создаются: из времени публикации берется только год.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        self.init_statistics()
+        self.vacancies_count = 0
+        for line in self.reader:
+            values = self.parse_statistics_values(line)
+            if values is None:
+                continue
+            name, salary, area, year = values
+            self.add_to_statistics(name, salary, area, year, selected_vacancy)
+            self.vacancies_count += 1
+        self.complete_statistics(selected_vacancy)
+
+    def get_statistics_cached(self, selected_vacancy: str):
+        """Производит расчет статистики по требуемой профессии так же, как get_statistics_streaming, но берет значения
+        вакансий из бинарного кэша рядом с файлом, если файл не изменился с прошлого запуска. При отсутствии записи в
+        кэше значения считываются из файла и сохраняются в кэш, если его удается записать.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        cache_key = dataset_cache.get_cache_key(self.__file_name, "statistics")
+        columns = dataset_cache.load_columns(self.__file_name, "statistics", cache_key)
+        if columns is None:
+            names, salaries, areas, years = [], [], [], []
+            for line in self.reader:
+                values = self.parse_statistics_values(line)
+                if values is not None:
+                    names.append(values[0])
+                    salaries.append(values[1])
+                    areas.append(values[2])
+                    years.append(values[3])
+            columns = {"name": names, "salary": np.array(salaries, dtype=np.float64), "area_name": areas,
+                       "year": np.array(years, dtype=np.int32)}
+            dataset_cache.save_columns(self.__file_name, "statistics", columns, cache_key=cache_key)
+        self.init_statistics()
+        self.vacancies_count = 0
+        for name, salary, area, year in zip(columns["name"], columns["salary"].tolist(), columns["area_name"],
+                                            columns["year"].tolist()):
+            self.add_to_statistics(name, salary, area, year, selected_vacancy)
+            self.vacancies_count += 1
+        self.complete_statistics(selected_vacancy)
+
+    def parse_statistics_values(self, line: list):
+        """Получает из строки csv файла значения, необходимые для статистики, без создания объектов вакансии и datetime.
+
+        Args:
+            line (list): Строка csv файла
+
+        Returns:
+            tuple: Название, средняя зарплата в рублях, регион и год публикации вакансии или None, если строка содержит
+            не все данные
+        """
+        if len(line) != len(self.__list_naming) or '' in line:
+            return None
+        salary = Salary(int(float(self.get_clear_value(line[1]))), int(float(self.get_clear_value(line[2]))),
+                        self.get_clear_value(line[3]))
+        return self.get_clear_value(line[0]), salary.get_rub_average(), self.get_clear_value(line[4]), \
+            datetime_parser.get_year(self.get_clear_value(line[5]))
+
+    def get_statistics_for_professions(self, selected_vacancies: list):
+        """Производит расчет статистики сразу для нескольких профессий за один проход по файлу. Профессии, названия
+        которых входят в название вакансии, находятся одним проходом автомата Ахо-Корасик по названию. Общая статистика
+        сохраняется так же, как в get_statistics_streaming, а статистика профессий - в statistics_by_profession.
+
+        Args:
+            selected_vacancies (list): Профессии, по которым требуется получить статистику
+        """
+        matcher = AhoCorasick(selected_vacancies)
+        salary_by_year_by_pattern = [{} for _ in matcher.patterns]
+        count_by_year_by_pattern = [{} for _ in matcher.patterns]
+        self.init_statistics()
+        self.vacancies_count = 0
+        for line in self.reader:
+            values = self.parse_statistics_values(line)
+            if values is None:
+                continue
+            name, salary, area, year = values
+            self.add_to_statistics(name, salary, area, year, '')
+            self.vacancies_count += 1
+            for i in matcher.find(name):
+                salary_by_year_by_pattern[i][year] = salary_by_year_by_pattern[i].get(year, 0) + salary
+                count_by_year_by_pattern[i][year] = count_by_year_by_pattern[i].get(year, 0) + 1
+        self.complete_statistics('')
+        self.statistics_by_profession = {}
+        for profession, salary_by_year, count_by_year in zip(matcher.patterns, salary_by_year_by_pattern,
+                                                             count_by_year_by_pattern):
+            if profession:
+                DataSet.complete_selected_statistics(salary_by_year, count_by_year)
+            self.statistics_by_profession[profession] = (salary_by_year, count_by_year)
+
+    def update_snapshot(self, snapshot: StatisticsSnapshot):
+        """Добавляет в снимок статистики вакансии из файла, опубликованные позже самой поздней учтенной в снимке вакансии,
+        а также еще не учтенные вакансии, опубликованные ровно в ее время, и сдвигает водяной знак. Вакансии,
+        опубликованные раньше водяного знака, не добавляются, их количество сохраняется в late_vacancies_count.
+
+        Args:
+            snapshot (StatisticsSnapshot): Снимок статистики
+
+        Returns:
+            int: Количество добавленных вакансий
+        """
+        new_vacancies_count = 0
+        self.late_vacancies_count = 0
+        processed_row_hashes = collections.Counter(snapshot.watermark_row_hashes or [])
+        latest_published_at, latest_published_at_str, latest_row_hashes = None, None, []
+        for line in self.reader:
+            if len(line) != len(self.__list_naming) or '' in line:
+                continue
+            published_at_str = self.get_clear_value(line[5])
+            published_at = datetime_parser.convert_str_to_datetime(published_at_str)
+            row_hash = None
+            if not snapshot.is_new(published_at):
+                if not snapshot.is_at_watermark(published_at):
+                    self.late_vacancies_count += 1
+                    continue
+                if snapshot.watermark_row_hashes is None:
+                    continue
+                row_hash = StatisticsSnapshot.get_row_hash(line)
+                if processed_row_hashes[row_hash] > 0:
+                    processed_row_hashes[row_hash] -= 1
+                    continue
+            salary = Salary(int(float(self.get_clear_value(line[1]))), int(float(self.get_clear_value(line[2]))),
+                            self.get_clear_value(line[3]))
+            snapshot.add(self.get_clear_value(line[0]), salary.get_rub_average(), self.get_clear_value(line[4]),
+                         published_at.year)
+            if latest_published_at is None or published_at > latest_published_at:
+                latest_published_at, latest_published_at_str, latest_row_hashes = published_at, published_at_str, []
+            if published_at == latest_published_at:
+                latest_row_hashes.append(row_hash or StatisticsSnapshot.get_row_hash(line))
+            new_vacancies_count += 1
+        if latest_published_at is not None:
+            if snapshot.is_at_watermark(latest_published_at):
+                snapshot.watermark_row_hashes = snapshot.watermark_row_hashes + latest_row_hashes
+            else:
+                snapshot.set_watermark(latest_published_at_str, latest_row_hashes)
+        return new_vacancies_count
+
+    def get_statistics_from_snapshot(self, snapshot: StatisticsSnapshot, selected_vacancy: str):
+        """Производит расчет статистики по требуемой профессии по накопленным суммам снимка статистики, не читая
+        вакансии из файлов. Названия вакансий требуемой профессии находятся по индексу n-грамм снимка.
+
+        Args:
+            snapshot (StatisticsSnapshot): Снимок статистики
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        self.init_statistics()
+        for year in sorted(snapshot.vacancies_count_by_year):
+            self.salary_by_year[year] = snapshot.salary_by_year[year]
+            self.vacancies_count_by_year[year] = snapshot.vacancies_count_by_year[year]
+        if selected_vacancy != '':
+            for name in snapshot.get_name_index().find(selected_vacancy):
+                for year, count in snapshot.vacancies_count_by_name_and_year[name].items():
+                    self.selected_vacancy_salary_by_year[year] = self.selected_vacancy_salary_by_year.get(year, 0) + \
+                                                                 snapshot.salary_by_name_and_year[name][year]
+                    self.selected_vacancy_count_by_year[year] = self.selected_vacancy_count_by_year.get(year, 0) + count
+            self.selected_vacancy_salary_by_year = dict(sorted(self.selected_vacancy_salary_by_year.items()))
+            self.selected_vacancy_count_by_year = dict(sorted(self.selected_vacancy_count_by_year.items()))
+        self.salary_by_area = dict(snapshot.salary_by_area)
+        self.vacancies_count_by_area = dict(snapshot.vacancies_count_by_area)
+        self.vacancies_count = sum(self.vacancies_count_by_year.values())
+        self.complete_statistics(selected_vacancy)
+
+    def init_statistics(self):
+        """Создает пустые словари статистики."""
         self.salary_by_year = {}
         self.vacancies_count_by_year = {}
         self.selected_vacancy_salary_by_year = {}
@@ -218,43 +738,52 @@ class DataSet:
         self.salary_by_area_appropriate = {}
         self.fraction_by_area = {}
         self.fraction_by_area_appropriate = {}
-        for vacancy in self.vacancies:
-            year = int(vacancy.published_at.strftime("%Y"))
-            salary = vacancy.salary.get_rub_average()
-            if year not in self.salary_by_year:
-                self.salary_by_year[year] = 0
-                self.vacancies_count_by_year[year] = 0
-            self.salary_by_year[year] += salary
-            self.vacancies_count_by_year[year] += 1
-            if selected_vacancy in vacancy.name and selected_vacancy != '':
-                if year not in self.selected_vacancy_salary_by_year:
-                    self.selected_vacancy_salary_by_year[year] = 0
-                    self.selected_vacancy_count_by_year[year] = 0
-                self.selected_vacancy_salary_by_year[year] += salary
-                self.selected_vacancy_count_by_year[year] += 1
-            area = vacancy.area_name
-            if area not in self.salary_by_area:
-                self.salary_by_area[area] = 0
-            self.salary_by_area[area] += salary
-            if area not in self.vacancies_count_by_area:
-                self.vacancies_count_by_area[area] = 0
-            self.vacancies_count_by_area[area] += 1
+
+    def add_to_statistics(self, name: str, salary: float, area: str, year: int, selected_vacancy: str):
+        """Добавляет зарплату вакансии к суммам и счетчикам статистики по годам и городам.
+
+        Args:
+            name (str): Название вакансии
+            salary (float): Средняя зарплата вакансии в рублях
+            area (str): Регион вакансии
+            year (int): Год публикации вакансии
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
+        if year not in self.salary_by_year:
+            self.salary_by_year[year] = 0
+            self.vacancies_count_by_year[year] = 0
+        self.salary_by_year[year] += salary
+        self.vacancies_count_by_year[year] += 1
+        if selected_vacancy in name and selected_vacancy != '':
+            if year not in self.selected_vacancy_salary_by_year:
+                self.selected_vacancy_salary_by_year[year] = 0
+                self.selected_vacancy_count_by_year[year] = 0
+            self.selected_vacancy_salary_by_year[year] += salary
+            self.selected_vacancy_count_by_year[year] += 1
+        if area not in self.salary_by_area:
+            self.salary_by_area[area] = 0
+        self.salary_by_area[area] += salary
+        if area not in self.vacancies_count_by_area:
+            self.vacancies_count_by_area[area] = 0
+        self.vacancies_count_by_area[area] += 1
+
+    def complete_statistics(self, selected_vacancy: str):
+        """Переводит накопленные суммы зарплат в средние значения и вычисляет доли вакансий по городам.
+
+        Args:
+            selected_vacancy (str): Профессия, по которой требуется получить статистику
+        """
         for year in self.salary_by_year:
             self.salary_by_year[year] = int(self.salary_by_year[year] / self.vacancies_count_by_year[year])
         for area in self.salary_by_area:
             self.salary_by_area[area] = int(self.salary_by_area[area] / self.vacancies_count_by_area[area])
-            self.fraction_by_area[area] = round(self.vacancies_count_by_area[area] / len(self.vacancies), 4)
+            self.fraction_by_area[area] = round(self.vacancies_count_by_area[area] / self.vacancies_count, 4)
             if int(self.fraction_by_area[area] * 100) >= 1:
                 self.salary_by_area_appropriate[area] = self.salary_by_area[area]
                 self.fraction_by_area_appropriate[area] = self.fraction_by_area[area]
         if selected_vacancy:
-            for year in self.selected_vacancy_salary_by_year:
-                if self.selected_vacancy_salary_by_year[year] != 0:
-                    self.selected_vacancy_salary_by_year[year] = int(
-                        self.selected_vacancy_salary_by_year[year] / self.selected_vacancy_count_by_year[year])
-            if len(self.selected_vacancy_salary_by_year) == 0:
-                self.selected_vacancy_salary_by_year[2022] = 0
-                self.selected_vacancy_count_by_year[2022] = 0
+            DataSet.complete_selected_statistics(self.selected_vacancy_salary_by_year,
+                                                 self.selected_vacancy_count_by_year)
         self.salary_by_area_appropriate = {k: v for k, v in
                                            sorted(self.salary_by_area_appropriate.items(), key=lambda item: item[1],
                                                   reverse=True)}
@@ -264,6 +793,27 @@ class DataSet:
         self.salary_by_area_sliced = dict(itertools.islice(self.salary_by_area_appropriate.items(), 10))
         self.fraction_by_area_sliced = dict(itertools.islice(self.fraction_by_area_appropriate.items(), 10))
 
+    @staticmethod
+    def complete_selected_statistics(salary_by_year: dict, count_by_year: dict):
+        """Переводит накопленные суммы зарплат выбранной профессии в средние значения. Если вакансий профессии нет,
+        добавляет нулевые значения за 2022 год.
+
+        Args:
+            salary_by_year (dict): Словарь суммы зарплат профессии по годам
+            count_by_year (dict): Словарь количества вакансий профессии по годам
+
+        >>> salary_by_year, count_by_year = {2021: 50001.0}, {2021: 2}
+        >>> DataSet.complete_selected_statistics(salary_by_year, count_by_year)
+        >>> salary_by_year
+        {2021: 25000}
+        """
+        for year in salary_by_year:
+            if salary_by_year[year] != 0:
+                salary_by_year[year] = int(salary_by_year[year] / count_by_year[year])
+        if len(salary_by_year) == 0:
+            salary_by_year[2022] = 0
+            count_by_year[2022] = 0
+
 
 class InputConnect:
     """Класс для ввода и вывода данных.
@@ -271,6 +821,7 @@ class InputConnect:
     Attributes:
         csv_file_name (str): Имя csv файла
         vacancy_name (str): Название профессии
+        snapshot_file_name (str): Имя json файла снимка накопленной статистики
     """
 
     def print_statistics(self, data_set: DataSet):
@@ -305,9 +856,15 @@ class InputConnect:
             return True
         return False
 
-    def __init__(self):
+    def __init__(self, snapshot_file_name: str = None):
         """Инициализирует объект класса InputConnect и создает отчет по статистике при корректности введенных
-        пользователем данных."""
+        пользователем данных. Если указан файл снимка статистики, вакансии из файла добавляются к снимку, а отчет
+        строится по всей накопленной статистике.
+
+        Args:
+            snapshot_file_name (str): Имя json файла снимка накопленной статистики
+        """
+        self.snapshot_file_name = snapshot_file_name
         self.ask_user()
         if self.check_input():
             data_set = DataSet(self.csv_file_name)
@@ -316,11 +873,16 @@ class InputConnect:
             except StopIteration:
                 print("Пустой файл")
             if not data_set.is_empty_file():
-                data_set.csv_filter()
-                if len(data_set.vacancies) == 0:
+                if self.snapshot_file_name:
+                    snapshot = StatisticsSnapshot.load(self.snapshot_file_name)
+                    data_set.update_snapshot(snapshot)
+                    snapshot.save(self.snapshot_file_name)
+                    data_set.get_statistics_from_snapshot(snapshot, self.vacancy_name)
+                else:
+                    data_set.get_statistics_cached(self.vacancy_name)
+                if data_set.vacancies_count == 0:
                     print("Нет данных")
                 else:
-                    data_set.get_statistics(self.vacancy_name)
                     Report.generate_excel(data_set.salary_by_year, data_set.selected_vacancy_salary_by_year,
                                           data_set.vacancies_count_by_year, data_set.selected_vacancy_count_by_year,
                                           data_set.salary_by_area_sliced, data_set.fraction_by_area_sliced,
@@ -640,5 +1202,25 @@ class Report:
             return '-\n'.join(str_splitted_by_hyphen)
 
 
+def parse_arguments(args: list = None):
+    """Разбирает аргументы командной строки программы статистики.
+
+    Args:
+        args (list): Список аргументов, по умолчанию берется из sys.argv
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы
+
+    >>> parse_arguments(["--snapshot", "snapshot.json"]).snapshot
+    'snapshot.json'
+    >>> parse_arguments([]).snapshot is None
+    True
+    """
+    parser = argparse.ArgumentParser(description="Вывод статистики по профессии")
+    parser.add_argument("--snapshot", default=None,
+                        help="json файл снимка статистики, к которому добавляются вакансии из csv файла")
+    return parser.parse_known_args(args)[0]
+
+
 if __name__ == "__main__":
-    app = InputConnect()
+    app = InputConnect(parse_arguments().snapshot)
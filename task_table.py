@@ -1,11 +1,13 @@
 import csv
 import re
 
-import dateutil.tz
-import dateutil.parser
+import numpy as np
 import prettytable
 import datetime
 
+import dataset_cache
+import datetime_parser
+
 
 class Vacancy:
     """Класс для представления вакансии.
@@ -20,6 +22,7 @@ class Vacancy:
         salary (Salary): Оклад вакансии
         area_name (str): Регион вакансии
         published_at (datetime): Время публикации вакансии
+        published_at_str (str): Время публикации вакансии в исходном строковом виде
     """
 
     def __init__(self, name: str, description: str, key_skills: list, experience_id: str, premium: str,
@@ -73,6 +76,7 @@ class Vacancy:
         self.employer_name = employer_name
         self.salary = salary
         self.area_name = area_name
+        self.published_at_str = published_at
         self.published_at = Vacancy.convert_str_to_datetime_using_string_parsing(published_at)
 
     # @staticmethod
@@ -81,18 +85,7 @@ class Vacancy:
 
     @staticmethod
     def convert_str_to_datetime_using_string_parsing(s: str) -> datetime:
-        year = int(s[:4])
-        month = int(s[5:7])
-        day = int(s[8:10])
-        hour = int(s[11:13])
-        minute = int(s[14:16])
-        second = int(s[17:19])
-        timezone_offset_hours_int = int(s[19:22])
-        timezone_delta = datetime.timedelta(hours=timezone_offset_hours_int)
-        if timezone_offset_hours_int < 0:
-            timezone_delta *= -1
-        timezone_offset = dateutil.tz.tzoffset(None, timezone_delta)
-        return datetime.datetime(year, month, day, hour, minute, second, tzinfo=timezone_offset)
+        return datetime_parser.convert_str_to_datetime(s)
 
     # @staticmethod
     # def convert_str_to_datetime_using_dateutil_parser(s: str) -> datetime:
@@ -160,6 +153,9 @@ class DataSet:
     """Класс для представления данных вакансий.
 
     Attributes:
+        html_tag_pattern (Pattern): (class attribute) Регулярное выражение html тега
+        dirty_str_pattern (Pattern): (class attribute) Регулярное выражение для поиска html тегов, переносов строк и
+        лишних пробелов
         __file_name (str): Имя файла для обработки данных
         __list_naming (list): Названия столбцов таблицы
         reader (_reader): Объект чтения для чтения строк из файла
@@ -167,6 +163,9 @@ class DataSet:
         vacancies_length_before_filtering (int): Количество вакансий до фильтрации по параметру
     """
 
+    html_tag_pattern = re.compile("<.*?>")
+    dirty_str_pattern = re.compile(r"<|\s\s|^\s|\s$|[^\S ]")
+
     def __init__(self, file_name: str):
         """Инициализирует объект DataSet.
 
@@ -194,6 +193,8 @@ class DataSet:
         >>> DataSet.get_clear_value("Без html-тегов\\nи лишних пробелов")
         'Без html-тегов\\nи лишних пробелов'
         """
+        if DataSet.dirty_str_pattern.search(value) is None:
+            return value
         temp = value.split('\n')
         result = [DataSet.get_clear_str(s) for s in temp]
         return '\n'.join(result)
@@ -214,8 +215,12 @@ class DataSet:
         'one two three 4'
         >>> DataSet.get_clear_str("<div><h1>Заголовок    1 уровня</h1></div>")
         'Заголовок 1 уровня'
+        >>> DataSet.get_clear_str(" \tбез тегов ")
+        'без тегов'
         """
-        str_without_tags = re.sub("<.*?>", '', s)
+        if DataSet.dirty_str_pattern.search(s) is None:
+            return s
+        str_without_tags = DataSet.html_tag_pattern.sub('', s)
         str_without_spaces = ' '.join(str_without_tags.split())
         return str_without_spaces
 
@@ -235,29 +240,94 @@ class DataSet:
 
     def csv_filter(self):
         """Считывает вакансии из файла, содержащие все необходимые данные, очищает их от лишних пробелов и html тегов
-         и сохраняет их в список вакансий, а также количество вакансий до фильтрации по параметру."""
+         и сохраняет их в список вакансий, а также количество вакансий до фильтрации по параметру. Очищаются только
+         текстовые столбцы, которые могут содержать html разметку."""
         self.vacancies = []
         for line in self.reader:
             if len(line) == len(self.__list_naming) and '' not in line:
                 name = DataSet.get_clear_value(line[0])
                 description = DataSet.get_clear_value(line[1])
                 key_skills = DataSet.get_clear_value(line[2]).split('\n')
-                experience_id = DataSet.get_clear_value(line[3])
-                premium = DataSet.get_clear_value(line[4])
+                experience_id = line[3]
+                premium = line[4]
                 employer_name = DataSet.get_clear_value(line[5])
-                salary_from = int(float(DataSet.get_clear_value(line[6])))
-                salary_to = int(float(DataSet.get_clear_value(line[7])))
-                salary_gross = DataSet.get_clear_value(line[8])
-                salary_currency = DataSet.get_clear_value(line[9])
+                salary_from = int(float(line[6]))
+                salary_to = int(float(line[7]))
+                salary_gross = line[8]
+                salary_currency = line[9]
                 salary = Salary(salary_from, salary_to, salary_gross, salary_currency)
                 area_name = DataSet.get_clear_value(line[10])
-                published_at = DataSet.get_clear_value(line[11])
+                published_at = line[11]
                 vacancy = Vacancy(name, description, key_skills, experience_id, premium, employer_name, salary,
                                   area_name, published_at)
                 salary.rub_average = salary.get_rub_average()
                 self.vacancies.append(vacancy)
         self.vacancies_length_before_filtering = len(self.vacancies)
 
+    def csv_filter_cached(self):
+        """Выполняет то же, что и csv_filter, но берет очищенные вакансии из бинарного кэша рядом с файлом, если файл не
+        изменился с прошлого запуска. При отсутствии записи в кэше вакансии считываются из файла и сохраняются в кэш, если
+        его удается записать."""
+        cache_key = dataset_cache.get_cache_key(self.__file_name, "table")
+        columns = dataset_cache.load_columns(self.__file_name, "table", cache_key)
+        if columns is None:
+            self.csv_filter()
+            dataset_cache.save_columns(self.__file_name, "table", DataSet.convert_vacancies_to_columns(self.vacancies),
+                                       cache_key=cache_key)
+        else:
+            self.vacancies = DataSet.convert_columns_to_vacancies(columns)
+            self.vacancies_length_before_filtering = len(self.vacancies)
+
+    @staticmethod
+    def convert_vacancies_to_columns(vacancies: list):
+        """Преобразует список вакансий в словарь столбцов для сохранения в кэш. Навыки объединяются символами переноса
+        строки, время публикации сохраняется в исходном строковом виде.
+
+        Args:
+            vacancies (list): Список вакансий
+
+        Returns:
+            dict: Словарь столбцов: массивов NumPy для чисел и списков строк
+        """
+        return {
+            "name": [v.name for v in vacancies],
+            "description": [v.description for v in vacancies],
+            "key_skills": ['\n'.join(v.key_skills) for v in vacancies],
+            "experience_id": [v.experience_id for v in vacancies],
+            "premium": np.array([v.premium for v in vacancies], dtype=np.bool_),
+            "employer_name": [v.employer_name for v in vacancies],
+            "salary_from": np.array([v.salary.salary_from for v in vacancies], dtype=np.int64),
+            "salary_to": np.array([v.salary.salary_to for v in vacancies], dtype=np.int64),
+            "salary_gross": [v.salary.salary_gross for v in vacancies],
+            "salary_currency": [v.salary.salary_currency for v in vacancies],
+            "area_name": [v.area_name for v in vacancies],
+            "published_at": [v.published_at_str for v in vacancies],
+        }
+
+    @staticmethod
+    def convert_columns_to_vacancies(columns: dict):
+        """Восстанавливает список вакансий из словаря столбцов, загруженного из кэша.
+
+        Args:
+            columns (dict): Словарь столбцов
+
+        Returns:
+            list: Список вакансий
+        """
+        vacancies = []
+        for name, description, key_skills, experience_id, premium, employer_name, salary_from, salary_to, \
+                salary_gross, salary_currency, area_name, published_at in zip(
+                    columns["name"], columns["description"], columns["key_skills"], columns["experience_id"],
+                    columns["premium"].tolist(), columns["employer_name"], columns["salary_from"].tolist(),
+                    columns["salary_to"].tolist(), columns["salary_gross"], columns["salary_currency"],
+                    columns["area_name"], columns["published_at"]):
+            salary = Salary(salary_from, salary_to, salary_gross, salary_currency)
+            vacancy = Vacancy(name, description, key_skills.split('\n'), experience_id, str(premium), employer_name,
+                              salary, area_name, published_at)
+            salary.rub_average = salary.get_rub_average()
+            vacancies.append(vacancy)
+        return vacancies
+
     def formatter(self, filter_key=None, filter_value=None):
         """Выполняет фильтрацию списка вакансий, если задан параметр фильтрации и его значение.
 
@@ -506,7 +576,7 @@ class InputConnect:
             except StopIteration:
                 print("Пустой файл")
             if not data_set.is_empty_file():
-                data_set.csv_filter()
+                data_set.csv_filter_cached()
                 if len(self.filter_parameter) == 2:
                     filter_key, filter_value = self.filter_parameter
                     if filter_key in InputConnect.valid_keys:
@@ -1,6 +1,20 @@
+import contextlib
 import datetime
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
+
+import dataset_cache
 from task_table import Vacancy, Salary, DataSet
+import task_statistics
+
+task_3_2_3_spec = importlib.util.spec_from_file_location("task_3_2_3", "task_3.2.3.py")
+task_3_2_3 = importlib.util.module_from_spec(task_3_2_3_spec)
+task_3_2_3_spec.loader.exec_module(task_3_2_3)
 
 
 class SalaryTests(unittest.TestCase):
@@ -81,6 +95,18 @@ class VacancyTests(unittest.TestCase):
                                                                                                  datetime.timedelta(
                                                                                                      seconds=10800))))
 
+    def test_vacancy_published_at_negative_offset(self):
+        self.assertEqual(Vacancy.convert_str_to_datetime_using_string_parsing("2022-11-23T00:00:00-0330").utcoffset(),
+                         datetime.timedelta(hours=-3, minutes=-30))
+
+    def test_vacancy_published_at_colon_offset(self):
+        self.assertEqual(Vacancy.convert_str_to_datetime_using_string_parsing("2022-11-23T00:00:00+03:00"),
+                         Vacancy.convert_str_to_datetime_using_string_parsing("2022-11-23T00:00:00+0300"))
+
+    def test_vacancy_published_at_timezone_is_cached(self):
+        self.assertIs(Vacancy.convert_str_to_datetime_using_string_parsing("2022-11-23T00:00:00+0300").tzinfo,
+                      Vacancy.convert_str_to_datetime_using_string_parsing("2021-01-01T12:30:00+0300").tzinfo)
+
 
 class DataSetTests(unittest.TestCase):
     def test_get_clear_string_html_tags(self):
@@ -150,6 +176,271 @@ class DataSetTests(unittest.TestCase):
                     "2022-11-23T00:00:00+0300"), "Идентификатор валюты оклада", "Евро"), True)
 
 
+class StatisticsTests(unittest.TestCase):
+    statistics_attributes = ["salary_by_year", "vacancies_count_by_year", "selected_vacancy_salary_by_year",
+                             "selected_vacancy_count_by_year", "salary_by_area_sliced", "fraction_by_area_sliced"]
+
+    def get_statistics(self, selected_vacancy):
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.csv_reader()
+        data_set.csv_filter()
+        data_set.get_statistics(selected_vacancy)
+        return data_set
+
+    def get_statistics_streaming(self, selected_vacancy):
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.csv_reader()
+        data_set.get_statistics_streaming(selected_vacancy)
+        return data_set
+
+    def test_streaming_statistics_same_as_materialized(self):
+        expected = self.get_statistics("Программист")
+        actual = self.get_statistics_streaming("Программист")
+        for attribute in self.statistics_attributes:
+            self.assertEqual(getattr(actual, attribute), getattr(expected, attribute))
+
+    def test_streaming_statistics_vacancies_count(self):
+        self.assertEqual(self.get_statistics_streaming("Программист").vacancies_count,
+                         len(self.get_statistics("Программист").vacancies))
+
+    def test_streaming_statistics_without_matches(self):
+        data_set = self.get_statistics_streaming("Несуществующая профессия")
+        self.assertEqual(data_set.selected_vacancy_salary_by_year, {2022: 0})
+
+    def update_snapshot(self, snapshot):
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.csv_reader()
+        return data_set.update_snapshot(snapshot)
+
+    def get_statistics_from_snapshot(self, snapshot, selected_vacancy):
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.get_statistics_from_snapshot(snapshot, selected_vacancy)
+        return data_set
+
+    def test_snapshot_statistics_same_as_streaming(self):
+        snapshot = task_statistics.StatisticsSnapshot()
+        self.update_snapshot(snapshot)
+        expected = self.get_statistics_streaming("Программист")
+        actual = self.get_statistics_from_snapshot(snapshot, "Программист")
+        for attribute in self.statistics_attributes:
+            self.assertEqual(getattr(actual, attribute), getattr(expected, attribute))
+
+    def test_snapshot_skips_already_processed_vacancies(self):
+        snapshot = task_statistics.StatisticsSnapshot()
+        first_count = self.update_snapshot(snapshot)
+        self.assertEqual(self.update_snapshot(snapshot), 0)
+        self.assertEqual(sum(snapshot.vacancies_count_by_year.values()), first_count)
+
+    def test_snapshot_save_and_load(self):
+        snapshot = task_statistics.StatisticsSnapshot()
+        self.update_snapshot(snapshot)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "snapshot.json")
+            snapshot.save(file_name)
+            loaded = task_statistics.StatisticsSnapshot.load(file_name)
+        self.assertEqual(loaded.watermark, snapshot.watermark)
+        self.assertEqual(loaded.vacancies_count_by_name_and_year, snapshot.vacancies_count_by_name_and_year)
+        self.assertEqual(self.get_statistics_from_snapshot(loaded, "Программист").salary_by_year,
+                         self.get_statistics_from_snapshot(snapshot, "Программист").salary_by_year)
+
+    def test_snapshot_adds_new_vacancies_published_at_watermark(self):
+        header = "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+        first = "Программист,10000,20000,RUR,Москва,2022-12-01T10:00:00+0300\n"
+        second = "Аналитик,30000,40000,RUR,Москва,2022-12-02T10:00:00+0300\n"
+        same_time = "Тестировщик,50000,60000,RUR,Казань,2022-12-02T10:00:00+0300\n"
+        snapshot = task_statistics.StatisticsSnapshot()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "vacancies.csv")
+            counts = []
+            for content in (header + first + second, header + second + same_time + first,
+                            header + second + same_time):
+                with open(file_name, 'w', encoding="utf-8") as file:
+                    file.write(content)
+                data_set = task_statistics.DataSet(file_name)
+                data_set.csv_reader()
+                counts.append((data_set.update_snapshot(snapshot), data_set.late_vacancies_count))
+        self.assertEqual(counts, [(2, 0), (1, 1), (0, 0)])
+        self.assertEqual(snapshot.vacancies_count_by_area, {"Москва": 2, "Казань": 1})
+
+    def test_professions_statistics_same_as_streaming(self):
+        professions = ["Программист", "менеджер", "Java", "Python", "Несуществующая профессия"]
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.csv_reader()
+        data_set.get_statistics_for_professions(professions)
+        for profession in professions:
+            expected = self.get_statistics_streaming(profession)
+            self.assertEqual(data_set.statistics_by_profession[profession],
+                             (expected.selected_vacancy_salary_by_year, expected.selected_vacancy_count_by_year))
+        self.assertEqual(data_set.salary_by_area_sliced, expected.salary_by_area_sliced)
+
+    def test_aho_corasick_overlapping_patterns(self):
+        self.assertEqual(task_statistics.AhoCorasick(["аналитик", "Системный аналитик", "тик"]).find(
+            "Ведущий системный аналитик"), {0, 2})
+
+
+class NameIndexTests(unittest.TestCase):
+    def get_names(self):
+        data_set = task_statistics.DataSet("vacancies_05_12_2022.csv")
+        data_set.csv_reader()
+        data_set.csv_filter()
+        return sorted({vacancy.name for vacancy in data_set.vacancies})
+
+    def test_find_same_as_substring_scan(self):
+        names = self.get_names()
+        name_index = task_statistics.NameIndex(names)
+        for substring in ["Программист", "менеджер", "Java", "ик", "1С", "Несуществующая профессия"]:
+            self.assertEqual(name_index.find(substring), [name for name in names if substring in name])
+
+    def test_snapshot_name_index_rebuilt_for_new_names(self):
+        snapshot = task_statistics.StatisticsSnapshot()
+        snapshot.add("Программист", 20000.0, "Москва", 2022)
+        self.assertEqual(snapshot.get_name_index().find("Аналитик"), [])
+        snapshot.add("Аналитик данных", 30000.0, "Москва", 2022)
+        self.assertEqual(snapshot.get_name_index().find("Аналитик"), ["Аналитик данных"])
+
+
+class DatasetCacheTests(unittest.TestCase):
+    table_csv = ("name,description,key_skills,experience_id,premium,employer_name,salary_from,salary_to,"
+                 "salary_gross,salary_currency,area_name,published_at\n"
+                 "Программист,<p>Описание   вакансии</p>,\"Python\nGit\",between1And3,True,ООО Рога и Копыта,"
+                 "20000.0,30000.0,True,RUR,Екатеринбург,2022-07-05T18:19:30+0300\n"
+                 "Аналитик,Описание,SQL,noExperience,False,CoolCompany,1500.0,2000.0,False,EUR,Москва,"
+                 "2022-07-06T10:00:00+0300\n")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def get_table_vacancies(self, file_name):
+        data_set = DataSet(file_name)
+        data_set.csv_reader()
+        data_set.csv_filter_cached()
+        return data_set
+
+    def test_table_vacancies_same_after_cache_hit(self):
+        file_name = os.path.join(self.directory, "vacancies.csv")
+        with open(file_name, 'w', encoding="utf-8") as file:
+            file.write(self.table_csv)
+        expected = self.get_table_vacancies(file_name)
+        self.assertIsNotNone(dataset_cache.load_columns(file_name, "table"))
+        actual = self.get_table_vacancies(file_name)
+        self.assertEqual(actual.vacancies_length_before_filtering, expected.vacancies_length_before_filtering)
+        for actual_vacancy, expected_vacancy in zip(actual.vacancies, expected.vacancies):
+            actual_values = vars(actual_vacancy).copy()
+            expected_values = vars(expected_vacancy).copy()
+            self.assertEqual(vars(actual_values.pop("salary")), vars(expected_values.pop("salary")))
+            self.assertEqual(actual_values, expected_values)
+
+    def test_statistics_same_after_cache_hit(self):
+        file_name = os.path.join(self.directory, "vacancies.csv")
+        shutil.copy("vacancies_05_12_2022.csv", file_name)
+        for _ in range(2):
+            data_set = task_statistics.DataSet(file_name)
+            data_set.csv_reader()
+            data_set.get_statistics_cached("Программист")
+            expected = task_statistics.DataSet(file_name)
+            expected.csv_reader()
+            expected.get_statistics_streaming("Программист")
+            for attribute in StatisticsTests.statistics_attributes + ["vacancies_count"]:
+                self.assertEqual(getattr(data_set, attribute), getattr(expected, attribute))
+
+    def test_unwritable_cache_falls_back_to_uncached(self):
+        file_name = os.path.join(self.directory, "vacancies.csv")
+        shutil.copy("vacancies_05_12_2022.csv", file_name)
+        with open(dataset_cache.get_cache_dir(file_name), 'w', encoding="utf-8") as file:
+            file.write("not a directory")
+        data_set = task_statistics.DataSet(file_name)
+        data_set.csv_reader()
+        data_set.get_statistics_cached("Программист")
+        expected = task_statistics.DataSet(file_name)
+        expected.csv_reader()
+        expected.get_statistics_streaming("Программист")
+        for attribute in StatisticsTests.statistics_attributes + ["vacancies_count"]:
+            self.assertEqual(getattr(data_set, attribute), getattr(expected, attribute))
+        self.assertIsNone(dataset_cache.load_columns(file_name, "statistics"))
+
+    def test_changed_file_is_not_loaded_from_cache(self):
+        file_name = os.path.join(self.directory, "vacancies.csv")
+        with open(file_name, 'w', encoding="utf-8") as file:
+            file.write(self.table_csv)
+        dataset_cache.save_columns(file_name, "table", {"name": ["Программист"]})
+        with open(file_name, 'a', encoding="utf-8") as file:
+            file.write(self.table_csv.split('\n', 1)[1])
+        self.assertIsNone(dataset_cache.load_columns(file_name, "table"))
+
+    def test_evict_least_recently_used(self):
+        first_file_name = os.path.join(self.directory, "first.csv")
+        second_file_name = os.path.join(self.directory, "second.csv")
+        for file_name in (first_file_name, second_file_name):
+            with open(file_name, 'w', encoding="utf-8") as file:
+                file.write(file_name)
+        dataset_cache.save_columns(first_file_name, "table", {"name": ["Программист"]})
+        dataset_cache.save_columns(second_file_name, "table", {"name": ["Аналитик"]})
+        cache_dir = dataset_cache.get_cache_dir(first_file_name)
+        entry_dir = os.path.join(cache_dir, dataset_cache.get_cache_key(first_file_name, "table"))
+        second_entry_dir = os.path.join(cache_dir, dataset_cache.get_cache_key(second_file_name, "table"))
+        os.utime(os.path.join(entry_dir, dataset_cache.META_FILE_NAME), (1, 1))
+        os.utime(os.path.join(second_entry_dir, dataset_cache.META_FILE_NAME), (2, 2))
+        self.assertEqual(list(dataset_cache.load_columns(first_file_name, "table")["name"]), ["Программист"])
+        dataset_cache.evict(cache_dir, dataset_cache.get_entry_size(entry_dir))
+        self.assertIsNotNone(dataset_cache.load_columns(first_file_name, "table"))
+        self.assertIsNone(dataset_cache.load_columns(second_file_name, "table"))
+
+
+
+class InteractiveSessionTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, "vacancies.csv")
+        with open(self.file_name, 'w', encoding="utf-8") as file:
+            file.write(DatasetCacheTests.table_csv)
+        self.app = task_3_2_3.InputConnect.__new__(task_3_2_3.InputConnect)
+        self.app.vacancy_range = []
+        self.app.columns_to_print = ['']
+        self.app.sorting_parameters = []
+        self.app.is_sorting_parameter_reverse = False
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def get_data_set(self, filter_key=None, filter_value=None):
+        data_set = task_3_2_3.DataSet(self.file_name)
+        with data_set:
+            data_set.csv_reader()
+            data_set.csv_filter_for_table(None, filter_key, filter_value)
+        return data_set
+
+    def get_session_output(self, answers, filter_key=None, filter_value=None):
+        output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=answers), contextlib.redirect_stdout(output):
+            self.app.run_session(self.get_data_set(), filter_key, filter_value)
+        return output.getvalue()
+
+    def get_query_output(self, filter_key=None, filter_value=None):
+        data_set = self.get_data_set(filter_key, filter_value)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.app.print_query(data_set, data_set.vacancies)
+        return output.getvalue()
+
+    def test_session_same_as_separate_queries(self):
+        expected = self.get_query_output("Название региона", "Москва") + \
+                   self.get_query_output("Идентификатор валюты оклада", "Рубли") + \
+                   self.get_query_output("Название региона", "Казань") + self.get_query_output()
+        actual = self.get_session_output(["Идентификатор валюты оклада: Рубли", "Название региона: Казань",
+                                          "Название: ", ""], "Название региона", "Москва")
+        self.assertEqual(actual, expected)
+
+    def test_session_salary_queries_same_as_separate_queries(self):
+        expected = "".join(self.get_query_output("Оклад", salary) for salary in ["25000", "1500", "2001", "30000"])
+        actual = self.get_session_output(["Оклад: 1500", "Оклад: 2001", "Оклад: 30000", ""], "Оклад", "25000")
+        self.assertEqual(actual, expected)
+
+    def test_session_reports_incorrect_filter(self):
+        output = self.get_session_output(["Москва", "Регион: Москва", EOFError()])
+        self.assertEqual(output, self.get_query_output() + "Формат ввода некорректен\nПараметр поиска некорректен\n")
 
 
 if __name__ == '__main__':